@@ -1,11 +1,38 @@
+import array
+import itertools
+import math
+import mmap
+import operator
+import os
+import sys
+import tempfile
+import time
 from abc import ABC, abstractmethod
-from typing import Any, List, Dict, Union, Optional
+from typing import Any, Iterator, List, Dict, Tuple, Union, Optional
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+class Validated:
+    """
+    Token proving that data already passed processor.validate().
+    process() trusts it instead of validating the data a second time.
+    """
+    __slots__ = ("processor", "data")
+
+    def __init__(self, processor: "DataProcessor", data: Any):
+        self.processor = processor
+        self.data = data
 
 class DataProcessor(ABC):
     """
     Abstract Base Class for data processing.
     Defines the interface for all specialized processors.
+    accepts lists the input types a processor can handle at all.
     """
+    accepts: Tuple[type, ...] = (object,)
     
     def __init__(self):
         super().__init__()
@@ -20,17 +47,174 @@ class DataProcessor(ABC):
         """Validate if data is appropriate for this processor"""
         pass
 
+    def validated(self, data: Any) -> Optional[Validated]:
+        """Validate once; return a token for process() or None"""
+        return Validated(self, data) if self.validate(data) else None
+
+    def _unwrap(self, data: Any) -> Any:
+        """Data behind a token from this processor, else validate it"""
+        if isinstance(data, Validated) and data.processor is self:
+            return data.data
+        if not self.validate(data):
+            raise ValueError(f"Invalid data provided to {type(self).__name__}")
+        return data
+
     def format_output(self, result: str) -> str:
         """Format the output string"""
         return f"Output: {result}"
 
+def _grow_partials(partials: List[float], x: float) -> None:
+    """Add x to a list of non-overlapping partial sums without rounding
+    (Shewchuk's algorithm, the one math.fsum uses internally)"""
+    i = 0
+    for y in partials:
+        if abs(x) < abs(y):
+            x, y = y, x
+        hi = x + y
+        lo = y - (hi - x)
+        if lo:
+            partials[i] = lo
+            i += 1
+        x = hi
+    partials[i:] = [x]
+
+class NumericSummary:
+    """
+    Running count/sum/mean/variance/min/max over chunks of numbers.
+    Each chunk is summed with math.fsum, then its rounding residual is
+    summed again (until it is zero) and all the pieces kept as exact
+    partials, so total equals math.fsum over the whole input. inf and
+    nan are tracked apart like fsum does (inf + -inf gives nan here
+    where fsum raises). The variance is computed around the first value
+    seen to avoid cancellation when the mean is large compared to the
+    spread.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.partials: List[float] = []
+        self.special = 0.0
+        self.shift: Optional[float] = None
+        self.shifted: List[float] = []
+        self.squares: List[float] = []
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def _add_exact(self, chunk: Any, total: float) -> None:
+        """Add the exact sum of chunk, given its rounded fsum"""
+        pieces = [total]
+        while True:
+            residual = math.fsum(itertools.chain(chunk,
+                                                 (-p for p in pieces)))
+            if not residual:
+                break
+            pieces.append(residual)
+        for piece in pieces:
+            _grow_partials(self.partials, piece)
+
+    def add_chunk(self, chunk: Any) -> None:
+        """chunk: a list or a memoryview slice of numbers"""
+        if not len(chunk):
+            return
+        try:
+            total = math.fsum(chunk)
+        except ValueError:
+            # inf and -inf in the same chunk
+            total = math.nan
+        self.count += len(chunk)
+        self.minimum = min(self.minimum, min(chunk))
+        self.maximum = max(self.maximum, max(chunk))
+        if not math.isfinite(total):
+            self.special += total
+            return
+        self._add_exact(chunk, total)
+        if self.shift is None:
+            self.shift = chunk[0] + 0.0
+        deltas = list(map(operator.sub, chunk, itertools.repeat(self.shift)))
+        _grow_partials(self.shifted, math.fsum(deltas))
+        _grow_partials(self.squares,
+                       math.fsum(map(operator.mul, deltas, deltas)))
+
+    @property
+    def total(self) -> float:
+        if self.special:
+            return self.special
+        return math.fsum(self.partials)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def variance(self) -> float:
+        if not self.count:
+            return 0.0
+        if self.special:
+            return math.nan
+        shifted = math.fsum(self.shifted)
+        squares = math.fsum(self.squares)
+        return max(squares - shifted * shifted / self.count, 0.0) / self.count
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.mean,
+            "variance": self.variance(),
+            "stddev": math.sqrt(self.variance()),
+            "min": self.minimum if self.count else 0.0,
+            "max": self.maximum if self.count else 0.0
+        }
+
+def _number_chunks(source: Any, chunk_size: int) -> Iterator[Any]:
+    """
+    Split a numeric source into chunks without copying where possible:
+    array.array/bytes/mmap are sliced through a memoryview, a path of
+    native doubles is read into one reused buffer (mapped pages would
+    count towards resident memory), anything else is read with islice.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        buffer = bytearray(chunk_size * 8)
+        with open(source, "rb") as file:
+            while True:
+                size = file.readinto(buffer)
+                if not size:
+                    return
+                if size % 8:
+                    raise ValueError(
+                        "Binary input must be a whole number of doubles")
+                with memoryview(buffer)[:size].cast("d") as chunk:
+                    yield chunk
+    if isinstance(source, (array.array, bytes, bytearray, mmap.mmap,
+                           memoryview)):
+        view = memoryview(source)
+        if view.format == "B":
+            if view.nbytes % 8:
+                raise ValueError(
+                    "Binary input must be a whole number of doubles")
+            view = view.cast("d")
+        try:
+            for start in range(0, len(view), chunk_size):
+                chunk = view[start:start + chunk_size]
+                yield chunk
+                chunk.release()
+        finally:
+            view.release()
+        return
+    iterator = iter(source)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
 class NumericProcessor(DataProcessor):
+    accepts = (list,)
+
     def validate(self, data: Any) -> bool:
         return isinstance(data, list) and all(isinstance(x, (int, float)) for x in data)
 
     def process(self, data: Any) -> str:
-        if not self.validate(data):
-            raise ValueError("Invalid data provided to NumericProcessor")
+        data = self._unwrap(data)
 
         try:
             total = sum(data)
@@ -39,23 +223,54 @@ class NumericProcessor(DataProcessor):
         except Exception as e:
             return f"Error processing numeric data: {e}"
 
+    def summarize(self, source: Any,
+                  chunk_size: int = 1 << 16) -> NumericSummary:
+        """
+        Streaming statistics over an iterable, an array.array, a bytes-like
+        buffer or mmap of native doubles, or the path of such a binary file.
+        Memory stays at one chunk whatever the input length. A str that is
+        not an existing file is rejected rather than read as a path.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        if isinstance(source, str) and not os.path.isfile(source):
+            raise ValueError("Invalid data provided to NumericProcessor")
+        summary = NumericSummary()
+        try:
+            for chunk in _number_chunks(source, chunk_size):
+                summary.add_chunk(chunk)
+        except TypeError:
+            raise ValueError("Invalid data provided to NumericProcessor")
+        return summary
+
+    def process_stream(self, source: Any, chunk_size: int = 1 << 16) -> str:
+        """
+        Same message as process(), computed with summarize(); sum and avg
+        are always floats here (sum=6.0 where process() prints sum=6)
+        """
+        summary = self.summarize(source, chunk_size)
+        return (f"Processed {summary.count} numeric values, "
+                f"sum={summary.total}, avg={summary.mean}")
+
 class TextProcessor(DataProcessor):
+    accepts = (str,)
+
     def validate(self, data: Any) -> bool:
         return isinstance(data, str)
 
     def process(self, data: Any) -> str:
-        if not self.validate(data):
-            raise ValueError("Invalid data provided to TextProcessor")
+        data = self._unwrap(data)
             
         return f"Processed text: {len(data)} characters, {len(data.split())} words"
 
 class LogProcessor(DataProcessor):
+    accepts = (str,)
+
     def validate(self, data: Any) -> bool:
         return isinstance(data, str) and ":" in data
 
     def process(self, data: Any) -> str:
-        if not self.validate(data):
-            raise ValueError("Invalid data provided to LogProcessor")
+        data = self._unwrap(data)
             
         try:
             parts = data.split(":", 1)
@@ -72,6 +287,85 @@ class LogProcessor(DataProcessor):
         except Exception as e:
             return f"Error processing log data: {e}"
 
+class ProcessorRegistry:
+    """
+    Picks the processor for each input of a mixed feed.
+    Candidates are the processors whose accepts matches type(data), in
+    registration order; that list is cached per input type, so only the
+    candidates' validate() runs, once each, and the winner's token is
+    passed straight to process().
+    """
+
+    def __init__(self, processors: Optional[List[DataProcessor]] = None):
+        self.processors: List[DataProcessor] = []
+        self.dispatch: Dict[type, List[DataProcessor]] = {}
+        for processor in processors or []:
+            self.register(processor)
+
+    @classmethod
+    def with_defaults(cls) -> "ProcessorRegistry":
+        # LogProcessor first: every log line would also pass as text
+        return cls([LogProcessor(), TextProcessor(), NumericProcessor()])
+
+    def register(self, processor: DataProcessor) -> None:
+        self.processors.append(processor)
+        self.dispatch.clear()
+
+    def candidates(self, data: Any) -> List[DataProcessor]:
+        kind = type(data)
+        found = self.dispatch.get(kind)
+        if found is None:
+            found = [p for p in self.processors if issubclass(kind, p.accepts)]
+            self.dispatch[kind] = found
+        return found
+
+    def select(self, data: Any) -> Validated:
+        for processor in self.candidates(data):
+            token = processor.validated(data)
+            if token is not None:
+                return token
+        raise ValueError(f"No processor accepts {type(data).__name__} data")
+
+    def process(self, data: Any) -> str:
+        token = self.select(data)
+        return token.processor.process(token)
+
+    def process_all(self, feed: List[Any]) -> List[str]:
+        return [self.process(data) for data in feed]
+
+def _peak_rss_mb() -> float:
+    if resource is None:
+        return 0.0
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def benchmark_binary_file(megabytes: int = 1024) -> None:
+    """Streaming summary of a binary file of doubles, time and peak memory"""
+    print(f"--- summarize() over a {megabytes:,} MB file of doubles ---")
+    block = array.array("d", (((i * 7919) % 10007) / 7.0
+                              for i in range(1 << 17)))
+    with tempfile.NamedTemporaryFile(suffix=".bin", delete=False) as file:
+        path = file.name
+        for _ in range(megabytes * (1 << 20) // (len(block) * 8)):
+            block.tofile(file)
+    try:
+        before = _peak_rss_mb()
+        start = time.perf_counter()
+        summary = NumericProcessor().summarize(path)
+        elapsed = time.perf_counter() - start
+        stats = summary.get_stats()
+        print(f"{stats['count']:,} values in {elapsed:.1f} s "
+              f"({megabytes / elapsed:,.0f} MB/s)")
+        print(f"sum={stats['sum']} mean={stats['mean']:.6f} "
+              f"stddev={stats['stddev']:.6f}")
+        print(f"peak RSS {before:.0f} MB -> {_peak_rss_mb():.0f} MB")
+    finally:
+        os.remove(path)
+
+def run_benchmarks(megabytes: int = 1024) -> None:
+    print("=== CODE NEXUS - NUMERIC STREAM BENCHMARKS ===\n")
+    benchmark_binary_file(megabytes)
+
 def main():
     print("=== CODE NEXUS - DATA PROCESSOR FOUNDATION ===")
 
@@ -82,9 +376,10 @@ def main():
     num_proc = NumericProcessor()
     data_num = [1, 2, 3, 4, 5]
     print(f"Processing data: {data_num}")
-    if num_proc.validate(data_num):
+    token = num_proc.validated(data_num)
+    if token:
         print("Validation: Numeric data verified")
-        result = num_proc.process(data_num)
+        result = num_proc.process(token)
         print(num_proc.format_output(result))
     
     # Text
@@ -92,9 +387,10 @@ def main():
     text_proc = TextProcessor()
     data_text = "Hello Nexus World"
     print(f"Processing data: \"{data_text}\"")
-    if text_proc.validate(data_text):
+    token = text_proc.validated(data_text)
+    if token:
         print("Validation: Text data verified")
-        result = text_proc.process(data_text)
+        result = text_proc.process(token)
         print(text_proc.format_output(result))
 
     # Log
@@ -102,9 +398,10 @@ def main():
     log_proc = LogProcessor()
     data_log = "ERROR: Connection timeout"
     print(f"Processing data: \"{data_log}\"")
-    if log_proc.validate(data_log):
+    token = log_proc.validated(data_log)
+    if token:
         print("Validation: Log entry verified")
-        result = log_proc.process(data_log)
+        result = log_proc.process(token)
         print(log_proc.format_output(result))
 
     # 2. Polymorphic Demo
@@ -120,8 +417,9 @@ def main():
     for i, (proc, data) in enumerate(processors, 1):
         try:
             # Polymorphism in action: calling same methods on different objects
-            if proc.validate(data):
-                res = proc.process(data)
+            token = proc.validated(data)
+            if token:
+                res = proc.process(token)
                 # Removing 'Output: ' prefix for the result list to match example strictly
                 # The example shows: "Result 1: Processed..."
                 # But format_output adds "Output: ". 
@@ -139,4 +437,9 @@ def main():
     print("Foundation systems online. Nexus ready for advanced streams.")
 
 if __name__ == "__main__":
+    if "--bench" in sys.argv[1:]:
+        # optional file size in MB after --bench, 1 GB by default
+        args = sys.argv[sys.argv.index("--bench") + 1:]
+        run_benchmarks(int(args[0]) if args else 1024)
+        sys.exit(0)
     main()
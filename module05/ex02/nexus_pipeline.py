@@ -1,20 +1,383 @@
+import array
+import asyncio
+import codecs
+import contextlib
+import copy
+import csv
+import hashlib
+import json
+import math
+import operator
+import heapq
+import itertools
+import os
+import pickle
+import struct
+import sys
+import threading
+import time
+import tracemalloc
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Protocol, Union
-from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from typing import (Any, Callable, Dict, Hashable, Iterable, Iterator, List,
+                    Optional, Protocol, Tuple, Union)
+from collections import OrderedDict, deque
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class ProcessingStage(Protocol):
-    """Protocol for pipeline stages (duck typing)."""
+    """Protocol for pipeline stages (duck typing).
+
+    Stages may also define process_batch(list) -> list; the pipeline
+    uses it in run_batch and falls back to process otherwise.
+    """
 
     def process(self, data: Any) -> Any:
         ...
 
 
+RECORD_STATUSES: Tuple[str, ...] = (
+    "parsed", "transformed", "delivered", "error"
+)
+_MISSING: Any = object()
+
+
+class RecordBatch:
+    """Columnar records: one column per data field plus status columns.
+
+    Fields whose values are all ints or all floats are stored as
+    array.array ('q' or 'd'), anything else (including fields missing
+    from some records) as a plain list. status holds indexes into
+    RECORD_STATUSES, transformed a 0/1 flag, and errors maps row index
+    to message for the few rows that failed.
+    """
+
+    def __init__(self, columns: Dict[str, Any], length: int):
+        self.columns: Dict[str, Any] = columns
+        self.length: int = length
+        self.status: array.array = array.array("B", [0]) * length
+        self.transformed: array.array = array.array("B", [0]) * length
+        self.errors: Dict[int, str] = {}
+        self.sparse: bool = any(isinstance(c, list) and _MISSING in c
+                                for c in columns.values())
+
+    def __len__(self) -> int:
+        return self.length
+
+    @staticmethod
+    def _column(values: List[Any]) -> Any:
+        if all(type(v) is int for v in values):
+            try:
+                return array.array("q", values)
+            except OverflowError:
+                return values
+        if all(type(v) is float for v in values):
+            return array.array("d", values)
+        return values
+
+    @classmethod
+    def from_records(cls, records: List[Dict[str, Any]]) -> "RecordBatch":
+        """Build a batch from today's input records (plain dicts)."""
+        fields: Dict[str, None] = {}
+        for record in records:
+            fields.update(dict.fromkeys(record))
+        columns: Dict[str, Any] = {
+            name: cls._column([record.get(name, _MISSING)
+                               for record in records])
+            for name in fields
+        }
+        return cls(columns, len(records))
+
+    @staticmethod
+    def is_wrapped(record: Any) -> bool:
+        """True for {"status", "data": dict} records and error records."""
+        return (isinstance(record, dict)
+                and record.get("status") in RECORD_STATUSES
+                and (isinstance(record.get("data"), dict)
+                     or "error" in record))
+
+    @classmethod
+    def from_wrapped(cls, records: List[Any]) -> "RecordBatch":
+        """Build a batch from stage output ({"status", "data", ...}).
+
+        Raises ValueError for any other record shape rather than
+        dropping its data.
+        """
+        for record in records:
+            if not cls.is_wrapped(record):
+                raise ValueError(f"RecordBatch cannot hold stage output "
+                                 f"{type(record).__name__}: {record!r:.60}")
+        batch: RecordBatch = cls.from_records(
+            [r.get("data") if isinstance(r.get("data"), dict) else {}
+             for r in records])
+        for i, record in enumerate(records):
+            batch.status[i] = RECORD_STATUSES.index(record["status"])
+            batch.transformed[i] = 1 if record.get("transformed") else 0
+            if "error" in record:
+                batch.errors[i] = str(record["error"])
+        return batch
+
+    def row(self, index: int) -> Dict[str, Any]:
+        return {name: column[index]
+                for name, column in self.columns.items()
+                if column[index] is not _MISSING}
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Convert back to the per-record dict shape stages produce."""
+        names: List[str] = list(self.columns)
+        rows = zip(*(self.columns[name] for name in names))
+        records: List[Dict[str, Any]] = []
+        for i, values in enumerate(rows):
+            status: str = RECORD_STATUSES[self.status[i]]
+            if i in self.errors:
+                records.append({"status": status, "error": self.errors[i]})
+                continue
+            data: Dict[str, Any] = dict(zip(names, values))
+            if self.sparse:
+                data = {k: v for k, v in data.items() if v is not _MISSING}
+            record: Dict[str, Any] = {"status": status, "data": data}
+            if self.transformed[i]:
+                record["transformed"] = True
+            records.append(record)
+        if not names:
+            records = [{"status": RECORD_STATUSES[code], "data": {}}
+                       for code in self.status]
+        return records
+
+    def set_status(self, status: str, skip_errors: bool = False) -> None:
+        code: int = RECORD_STATUSES.index(status)
+        saved: Dict[int, int] = ({i: self.status[i] for i in self.errors}
+                                 if skip_errors else {})
+        self.status = array.array("B", [code]) * self.length
+        for i, previous in saved.items():
+            self.status[i] = previous
+
+
+class Codec(ABC):
+    """Wire format used by InputStage (decode) and OutputStage (encode)."""
+
+    @abstractmethod
+    def encode(self, obj: Any) -> bytes:
+        pass
+
+    @abstractmethod
+    def decode(self, buffer: Any) -> Any:
+        pass
+
+    @abstractmethod
+    def iter_decode(self, source: Any) -> Iterator[Any]:
+        """Lazily decode every message in a buffer or file object."""
+        pass
+
+
+class JSONCodec(Codec):
+    """Newline-delimited JSON, the baseline wire format."""
+
+    def encode(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode() + b"\n"
+
+    def decode(self, buffer: Any) -> Any:
+        return json.loads(bytes(buffer))
+
+    def iter_decode(self, source: Any) -> Iterator[Any]:
+        for line in iter_lines(source):
+            if line.strip():
+                yield json.loads(line)
+
+
+class BinaryCodec(Codec):
+    """Compact length-prefixed binary format built on struct/array.
+
+    Every message is its payload length followed by a tagged value:
+    N/T/F, j (int32), i (int64), d (float64), s (utf-8), b (bytes),
+    a (array.array or typed memoryview: typecode + raw native items),
+    l (list), m (dict with str keys). Lengths and counts take one byte,
+    or 0xFF plus a little-endian u32 from 255 up.
+    Decoding bytes and arrays returns memoryview slices of the input
+    buffer, so those payloads are never copied.
+    """
+
+    LENGTH: struct.Struct = struct.Struct("<I")
+    INT32: struct.Struct = struct.Struct("<i")
+    INT: struct.Struct = struct.Struct("<q")
+    FLOAT: struct.Struct = struct.Struct("<d")
+
+    def encode(self, obj: Any) -> bytes:
+        parts: List[bytes] = []
+        self._pack(obj, parts)
+        payload: bytes = b"".join(parts)
+        header: List[bytes] = []
+        self._pack_length(len(payload), header)
+        return b"".join(header) + payload
+
+    def _pack_length(self, length: int, parts: List[bytes]) -> None:
+        if length < 0xFF:
+            parts.append(bytes((length,)))
+        else:
+            parts.append(b"\xff")
+            parts.append(self.LENGTH.pack(length))
+
+    def _pack_sized(self, tag: bytes, raw: bytes, parts: List[bytes]) -> None:
+        parts.append(tag)
+        self._pack_length(len(raw), parts)
+        parts.append(raw)
+
+    def _pack(self, obj: Any, parts: List[bytes]) -> None:
+        if obj is None:
+            parts.append(b"N")
+        elif obj is True:
+            parts.append(b"T")
+        elif obj is False:
+            parts.append(b"F")
+        elif isinstance(obj, int):
+            if -2 ** 31 <= obj < 2 ** 31:
+                parts.append(b"j")
+                parts.append(self.INT32.pack(obj))
+                return
+            if not -2 ** 63 <= obj < 2 ** 63:
+                raise OverflowError("BinaryCodec ints are limited to int64")
+            parts.append(b"i")
+            parts.append(self.INT.pack(obj))
+        elif isinstance(obj, float):
+            parts.append(b"d")
+            parts.append(self.FLOAT.pack(obj))
+        elif isinstance(obj, str):
+            self._pack_sized(b"s", obj.encode(), parts)
+        elif isinstance(obj, array.array) or (
+                isinstance(obj, memoryview) and obj.format != "B"
+                and obj.format in array.typecodes):
+            typecode: str = (obj.typecode if isinstance(obj, array.array)
+                             else obj.format)
+            parts.append(b"a")
+            parts.append(typecode.encode())
+            self._pack_sized(b"", obj.tobytes(), parts)
+        elif isinstance(obj, (bytes, bytearray, memoryview)):
+            self._pack_sized(b"b", bytes(obj), parts)
+        elif isinstance(obj, (list, tuple)):
+            parts.append(b"l")
+            self._pack_length(len(obj), parts)
+            for item in obj:
+                self._pack(item, parts)
+        elif isinstance(obj, dict):
+            parts.append(b"m")
+            self._pack_length(len(obj), parts)
+            for key, value in obj.items():
+                self._pack_sized(b"", str(key).encode(), parts)
+                self._pack(value, parts)
+        else:
+            raise TypeError(f"BinaryCodec cannot encode "
+                            f"{type(obj).__name__}")
+
+    def _unpack_length(self, view: memoryview, pos: int) -> Tuple[int, int]:
+        length: int = view[pos]
+        if length < 0xFF:
+            return length, pos + 1
+        return self.LENGTH.unpack_from(view, pos + 1)[0], pos + 5
+
+    def _sized(self, view: memoryview, pos: int) -> Tuple[memoryview, int]:
+        size, pos = self._unpack_length(view, pos)
+        if pos + size > len(view):
+            raise ValueError("BinaryCodec: truncated message")
+        return view[pos:pos + size], pos + size
+
+    def _unpack(self, view: memoryview, pos: int) -> Tuple[Any, int]:
+        tag: int = view[pos]
+        pos += 1
+        if tag == 0x6A:
+            return self.INT32.unpack_from(view, pos)[0], pos + 4
+        if tag == 0x69:
+            return self.INT.unpack_from(view, pos)[0], pos + 8
+        if tag == 0x64:
+            return self.FLOAT.unpack_from(view, pos)[0], pos + 8
+        if tag == 0x4E:
+            return None, pos
+        if tag in (0x54, 0x46):
+            return tag == 0x54, pos
+        if tag == 0x73:
+            raw, pos = self._sized(view, pos)
+            return str(raw, "utf-8"), pos
+        if tag == 0x62:
+            return self._sized(view, pos)
+        if tag == 0x61:
+            typecode: str = chr(view[pos])
+            raw, pos = self._sized(view, pos + 1)
+            return raw.cast(typecode), pos
+        if tag == 0x6C:
+            count, pos = self._unpack_length(view, pos)
+            items: List[Any] = []
+            for _ in range(count):
+                item, pos = self._unpack(view, pos)
+                items.append(item)
+            return items, pos
+        if tag == 0x6D:
+            count, pos = self._unpack_length(view, pos)
+            record: Dict[str, Any] = {}
+            for _ in range(count):
+                key, pos = self._sized(view, pos)
+                record[str(key, "utf-8")], pos = self._unpack(view, pos)
+            return record, pos
+        raise ValueError(f"BinaryCodec: unknown tag {tag:#x} at {pos - 1}")
+
+    def _unpack_message(self, view: memoryview) -> Any:
+        """Decode one payload; short or bad reads become ValueError."""
+        try:
+            return self._unpack(view, 0)[0]
+        except (struct.error, IndexError, TypeError) as e:
+            raise ValueError(f"BinaryCodec: truncated or malformed "
+                             f"message ({e})")
+
+    def _message_at(self, view: memoryview, pos: int) -> Tuple[Any, int]:
+        """Decode the message starting at pos; return it and its end."""
+        if pos >= len(view) or (view[pos] == 0xFF and pos + 5 > len(view)):
+            raise ValueError("BinaryCodec: truncated header")
+        size, start = self._unpack_length(view, pos)
+        if start + size > len(view):
+            raise ValueError("BinaryCodec: truncated message")
+        return (self._unpack_message(view[start:start + size]),
+                start + size)
+
+    def decode(self, buffer: Any) -> Any:
+        return self._message_at(memoryview(buffer).cast("B"), 0)[0]
+
+    def iter_decode(self, source: Any) -> Iterator[Any]:
+        if not hasattr(source, "read"):
+            view: memoryview = memoryview(source).cast("B")
+            pos: int = 0
+            while pos < len(view):
+                message, pos = self._message_at(view, pos)
+                yield message
+            return
+        while True:
+            header: bytes = source.read(1)
+            if not header:
+                return
+            if header == b"\xff":
+                header += source.read(4)
+                if len(header) < 5:
+                    raise ValueError("BinaryCodec: truncated header")
+            size: int = self._unpack_length(memoryview(header), 0)[0]
+            payload: bytes = source.read(size)
+            if len(payload) < size:
+                raise ValueError("BinaryCodec: truncated message")
+            yield self._unpack_message(memoryview(payload))
+
+
 class InputStage:
     """Validates and parses input data."""
 
+    def __init__(self, codec: Optional[Codec] = None):
+        self.codec: Optional[Codec] = codec
+
     def process(self, data: Any) -> Any:
         try:
+            if self.codec is not None and isinstance(
+                    data, (bytes, bytearray, memoryview)):
+                data = self.codec.decode(data)
             if isinstance(data, dict):
                 return {"status": "parsed", "data": data}
             if isinstance(data, str):
@@ -25,6 +388,22 @@ class InputStage:
         except Exception as e:
             return {"status": "error", "error": str(e)}
 
+    def process_batch(self, batch: List[Any]) -> List[Any]:
+        if self.codec is not None:
+            batch = [self.codec.decode(item) if isinstance(
+                item, (bytes, bytearray, memoryview)) else item
+                for item in batch]
+        return [
+            {"status": "parsed",
+             "data": item if isinstance(item, (dict, str, list))
+             else str(item)}
+            for item in batch
+        ]
+
+    def process_columns(self, batch: RecordBatch) -> RecordBatch:
+        batch.set_status("parsed", skip_errors=True)
+        return batch
+
 
 class TransformStage:
     """Transforms and enriches data."""
@@ -38,18 +417,374 @@ class TransformStage:
         except Exception as e:
             return {"status": "error", "error": str(e)}
 
+    def process_batch(self, batch: List[Any]) -> List[Any]:
+        for item in batch:
+            if isinstance(item, dict) and "data" in item:
+                item["transformed"] = True
+                item["status"] = "transformed"
+        return batch
+
+    def process_columns(self, batch: RecordBatch) -> RecordBatch:
+        batch.set_status("transformed", skip_errors=True)
+        batch.transformed = array.array("B", [1]) * len(batch)
+        for i in batch.errors:
+            batch.transformed[i] = 0
+        return batch
+
 
 class OutputStage:
     """Formats data for output."""
 
+    def __init__(self, codec: Optional[Codec] = None):
+        self.codec: Optional[Codec] = codec
+
     def process(self, data: Any) -> Any:
         try:
             if isinstance(data, dict):
                 data["status"] = "delivered"
+            if self.codec is not None:
+                return self.codec.encode(data)
             return data
         except Exception as e:
             return {"status": "error", "error": str(e)}
 
+    def process_batch(self, batch: List[Any]) -> List[Any]:
+        for item in batch:
+            if isinstance(item, dict):
+                item["status"] = "delivered"
+        if self.codec is not None:
+            return [self.codec.encode(item) for item in batch]
+        return batch
+
+    def process_columns(self, batch: RecordBatch) -> RecordBatch:
+        batch.set_status("delivered")
+        return batch
+
+
+class LatencyHistogram:
+    """Log-linear latency histogram in nanoseconds (HDR style).
+
+    Values below 64ns get exact buckets; above that every power of two
+    is split into 32 sub-buckets, so percentiles are within ~3% while
+    memory stays a few hundred counters at most.
+    """
+
+    SUB_BUCKET_BITS: int = 5
+
+    def __init__(self) -> None:
+        self.counts: Dict[int, int] = {}
+        self.calls: int = 0
+        self.total_ns: int = 0
+
+    def record(self, value_ns: int) -> None:
+        shift: int = max(value_ns.bit_length() - self.SUB_BUCKET_BITS - 1, 0)
+        index: int = (shift << self.SUB_BUCKET_BITS) + (value_ns >> shift)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.calls += 1
+        self.total_ns += value_ns
+
+    def bucket_value(self, index: int) -> int:
+        """Highest value that lands in bucket index."""
+        if index < 2 << self.SUB_BUCKET_BITS:
+            return index
+        shift: int = (index >> self.SUB_BUCKET_BITS) - 1
+        mantissa: int = index - (shift << self.SUB_BUCKET_BITS)
+        return (mantissa << shift) + (1 << shift) - 1
+
+    def percentile(self, percent: float) -> int:
+        if not self.calls:
+            return 0
+        target: int = max(math.ceil(self.calls * percent / 100), 1)
+        seen: int = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return self.bucket_value(index)
+        return self.bucket_value(max(self.counts))
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.calls += other.calls
+        self.total_ns += other.total_ns
+
+
+PROFILE_PERCENTILES: Tuple[int, ...] = (50, 95, 99)
+
+
+def profile_stats(names: List[str],
+                  profiles: List[LatencyHistogram]
+                  ) -> Dict[str, Union[str, int, float]]:
+    """Flatten per-stage histograms into get_stats() keys."""
+    stats: Dict[str, Union[str, int, float]] = {}
+    for index, (name, histogram) in enumerate(zip(names, profiles)):
+        prefix: str = f"stage_{index}_{name}"
+        stats[f"{prefix}_calls"] = histogram.calls
+        stats[f"{prefix}_total_ms"] = histogram.total_ns / 1e6
+        for percent in PROFILE_PERCENTILES:
+            stats[f"{prefix}_p{percent}_us"] = (
+                histogram.percentile(percent) / 1e3)
+    return stats
+
+
+class ResultCache:
+    """Bounded memo of pure-stage outputs with LRU and optional TTL.
+
+    Keys are a stable digest of the stage position and its input, so
+    identical records hit regardless of dict key order. Containers are
+    copied in and out, so later stages mutating a record in place can't
+    corrupt the cached value.
+    """
+
+    def __init__(self, max_entries: int = 1024,
+                 ttl: Optional[float] = None):
+        self.max_entries: int = max_entries
+        self.ttl: Optional[float] = ttl
+        self.entries: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    @classmethod
+    def canonical(cls, data: Any) -> Any:
+        """Type-tagged, order-independent form of a JSON-like value, so
+        {1: "a"} and {"1": "a"} (or a tuple and a list) differ."""
+        if isinstance(data, dict):
+            items: List[Tuple[Any, Any]] = [
+                (cls.canonical(key), cls.canonical(value))
+                for key, value in data.items()]
+            return ("dict", tuple(sorted(items, key=repr)))
+        if isinstance(data, (list, tuple)):
+            return (type(data).__name__,
+                    tuple(cls.canonical(item) for item in data))
+        if data is None or type(data) in (bool, int, float, str):
+            return (type(data).__name__, data)
+        raise TypeError(f"uncacheable {type(data).__name__}")
+
+    @classmethod
+    def make_key(cls, scope: int, data: Any) -> Optional[str]:
+        try:
+            payload: str = repr(cls.canonical(data))
+        except (TypeError, RecursionError):
+            return None
+        digest = hashlib.blake2b(payload.encode(), digest_size=16)
+        return f"{scope}:{digest.hexdigest()}"
+
+    def call(self, scope: int, func: Callable[[Any], Any],
+             data: Any) -> Any:
+        """Return func(data), served from the cache when possible."""
+        key: Optional[str] = self.make_key(scope, data)
+        if key is None:
+            return func(data)
+        entry: Optional[Tuple[float, Any]] = self.entries.get(key)
+        now: float = time.monotonic()
+        if entry is not None:
+            if self.ttl is None or now - entry[0] <= self.ttl:
+                self.hits += 1
+                self.entries.move_to_end(key)
+                return copy.deepcopy(entry[1])
+            del self.entries[key]
+            self.evictions += 1
+        self.misses += 1
+        result: Any = func(data)
+        self.entries[key] = (now, copy.deepcopy(result))
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        return result
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def get_stats(self) -> Dict[str, Union[str, int, float]]:
+        return {
+            "cache_hits": self.hits,
+            "cache_misses": self.misses,
+            "cache_evictions": self.evictions,
+            "cache_size": len(self.entries),
+        }
+
+
+def _fuse_parse_chain(transform: bool,
+                      output: bool) -> Callable[[Any], Any]:
+    """One callable equivalent to InputStage [-> Transform] [-> Output].
+
+    The stage sequence is fixed at compile time, so the record goes
+    through a single type check and a single dict build.
+    """
+    status: str = ("delivered" if output
+                   else "transformed" if transform else "parsed")
+    error_status: str = "delivered" if output else "error"
+    native: Tuple[type, ...] = (dict, str, list)
+
+    def fused(data: Any) -> Any:
+        if not isinstance(data, native):
+            try:
+                data = str(data)
+            except Exception as e:
+                return {"status": error_status, "error": str(e)}
+        if transform:
+            return {"status": status, "data": data, "transformed": True}
+        return {"status": status, "data": data}
+
+    return fused
+
+
+def _fused_spans(stages: List[ProcessingStage]
+                 ) -> List[Tuple[int, int, Optional[Callable[[Any], Any]]]]:
+    """(start, end, fused) steps over stages: fused is one callable for a
+    run of built-in stages, None for a single stage kept as it is."""
+    spans: List[Tuple[int, int, Optional[Callable[[Any], Any]]]] = []
+    i: int = 0
+    while i < len(stages):
+        if type(stages[i]) is InputStage and stages[i].codec is None:
+            transform: bool = (i + 1 < len(stages)
+                               and type(stages[i + 1]) is TransformStage)
+            j: int = i + 1 + int(transform)
+            output: bool = (j < len(stages) and type(stages[j]) is OutputStage
+                            and stages[j].codec is None)
+            spans.append((i, j + int(output),
+                          _fuse_parse_chain(transform, output)))
+            i = j + int(output)
+        else:
+            spans.append((i, i + 1, None))
+            i += 1
+    return spans
+
+
+def _fuse_stages(stages: List[ProcessingStage]
+                 ) -> List[Tuple[str, Callable[[Any], Any]]]:
+    """Collapse runs of built-in stages; keep the others as bound calls."""
+    steps: List[Tuple[str, Callable[[Any], Any]]] = []
+    for start, end, fused in _fused_spans(stages):
+        if fused is None:
+            steps.append((type(stages[start]).__name__,
+                          stages[start].process))
+        else:
+            steps.append(("+".join(type(stage).__name__
+                                   for stage in stages[start:end]), fused))
+    return steps
+
+
+class DeadLetterQueue:
+    """Bounded queue of failed records that spills to disk when full.
+
+    Each entry is a dict with pipeline_id, stage, error, data, attempts
+    and failed_at. Past max_entries the oldest entries are pickled to
+    spill_path and read back once memory drains; without a spill_path
+    they are dropped and counted.
+    """
+
+    def __init__(self, max_entries: int = 1000,
+                 spill_path: Optional[str] = None):
+        self.max_entries: int = max_entries
+        self.spill_path: Optional[str] = spill_path
+        self.entries: deque = deque()
+        self.parked: deque = deque(maxlen=max_entries)
+        self.lock: threading.Lock = threading.Lock()
+        self.spill_read: int = 0
+        self.spill_write: int = 0
+        self.spilled: int = 0
+        self.stats: Dict[str, Union[str, int, float]] = {
+            "dead_letters": 0, "spilled": 0, "dropped": 0, "parked": 0
+        }
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state: Dict[str, Any] = self.__dict__.copy()
+        del state["lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    def put(self, entry: Dict[str, Any]) -> None:
+        with self.lock:
+            self.stats["dead_letters"] += 1
+            self.entries.append(entry)
+            if len(self.entries) > self.max_entries:
+                self._spill(self.entries.popleft())
+
+    def _spill(self, entry: Dict[str, Any]) -> None:
+        if self.spill_path is None:
+            self.stats["dropped"] += 1
+            return
+        try:
+            payload: bytes = pickle.dumps(entry)
+        except Exception:
+            entry = {**entry, "data": repr(entry["data"])}
+            payload = pickle.dumps(entry)
+        # the first spill truncates whatever an earlier run left behind
+        mode: str = "ab" if self.spill_write else "wb"
+        with open(self.spill_path, mode) as spill:
+            spill.write(payload)
+            self.spill_write = spill.tell()
+        self.spilled += 1
+        self.stats["spilled"] += 1
+
+    def get(self) -> Optional[Dict[str, Any]]:
+        """Oldest entry, spilled ones first; None when empty."""
+        with self.lock:
+            if self.spilled and self.spill_path is not None:
+                with open(self.spill_path, "rb") as spill:
+                    spill.seek(self.spill_read)
+                    entry: Dict[str, Any] = pickle.load(spill)
+                    self.spill_read = spill.tell()
+                self.spilled -= 1
+                if not self.spilled:
+                    os.remove(self.spill_path)
+                    self.spill_read = self.spill_write = 0
+                return entry
+            return self.entries.popleft() if self.entries else None
+
+    def park(self, entry: Dict[str, Any]) -> None:
+        """Keep an entry aside for manual inspection; no more retries."""
+        with self.lock:
+            self.parked.append(entry)
+            self.stats["parked"] += 1
+
+    def __len__(self) -> int:
+        return len(self.entries) + self.spilled
+
+    def get_stats(self) -> Dict[str, Union[str, int, float]]:
+        return {**self.stats, "pending": len(self)}
+
+
+class RetryPolicy(ABC):
+    """Decides when a dead letter is retried, or parked for good."""
+
+    def __init__(self, max_attempts: int = 3):
+        self.max_attempts: int = max_attempts
+
+    @abstractmethod
+    def delay(self, attempts: int) -> Optional[float]:
+        """Seconds before the next attempt, or None to park the entry."""
+        pass
+
+
+class ImmediateRetry(RetryPolicy):
+    def delay(self, attempts: int) -> Optional[float]:
+        return 0.0 if attempts < self.max_attempts else None
+
+
+class ExponentialBackoff(RetryPolicy):
+    def __init__(self, max_attempts: int = 5, base: float = 0.1,
+                 factor: float = 2.0, max_delay: float = 30.0):
+        super().__init__(max_attempts)
+        self.base: float = base
+        self.factor: float = factor
+        self.max_delay: float = max_delay
+
+    def delay(self, attempts: int) -> Optional[float]:
+        if attempts >= self.max_attempts:
+            return None
+        return min(self.base * self.factor ** attempts, self.max_delay)
+
+
+class ParkPolicy(RetryPolicy):
+    def delay(self, attempts: int) -> Optional[float]:
+        return None
+
 
 class ProcessingPipeline(ABC):
     """Abstract base class for pipelines with configurable stages."""
@@ -61,42 +796,528 @@ class ProcessingPipeline(ABC):
         self.stats: Dict[str, Union[str, int, float]] = {
             "processed": 0, "errors": 0
         }
+        self.stage_stats: List[Dict[str, Union[str, int, float]]] = []
+        self.compiled: Optional[Callable[[Any], Any]] = None
+        self.stage_profiles: Optional[List[LatencyHistogram]] = None
+        self.result_cache: Optional[ResultCache] = None
+        self.dead_letters: Optional[DeadLetterQueue] = None
+        self.stage_executors: Dict[int, ThreadPoolExecutor] = {}
+        self.lock: Optional[threading.Lock] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state: Dict[str, Any] = self.__dict__.copy()
+        state["compiled"] = self.compiled is not None
+        state["stage_executors"] = {}
+        state["lock"] = self.lock is not None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        recompile: bool = bool(state.pop("compiled", False))
+        locked: bool = bool(state.pop("lock", False))
+        self.__dict__.update(state)
+        self.compiled = None
+        self.lock = threading.Lock() if locked else None
+        if recompile:
+            self.compile()
 
     def add_stage(self, stage: ProcessingStage) -> None:
         self.stages.append(stage)
+        self.compiled = None
+        self.stage_stats.append({
+            "stage": type(stage).__name__, "records": 0, "seconds": 0.0
+        })
+        if getattr(stage, "io_bound", False):
+            self.stage_stats[-1].update({"queue_depth": 0,
+                                         "max_queue_depth": 0})
+        if self.stage_profiles is not None:
+            self.stage_profiles.append(LatencyHistogram())
+        if self.result_cache is not None:
+            self.result_cache.clear()
+
+    def enable_profiling(self) -> None:
+        """Time every stage call in run_pipeline (off by default)."""
+        if self.stage_profiles is None:
+            self.stage_profiles = [LatencyHistogram() for _ in self.stages]
+
+    def disable_profiling(self) -> None:
+        self.stage_profiles = None
+
+    def enable_cache(self, max_entries: int = 1024,
+                     ttl: Optional[float] = None) -> None:
+        """Memoize stages that declare pure = True (off by default)."""
+        self.result_cache = ResultCache(max_entries, ttl)
+
+    def disable_cache(self) -> None:
+        self.result_cache = None
+
+    def attach_dead_letters(self, queue: "DeadLetterQueue") -> None:
+        """Capture every failed record in queue instead of dropping it."""
+        self.dead_letters = queue
+
+    def enable_locking(self) -> None:
+        """Serialize run_pipeline, run_batch, the columnar runs and replay
+        on one lock, for when another thread drives the same stages and
+        stats (off by default; DeadLetterReplayer.start turns it on)."""
+        if self.lock is None:
+            self.lock = threading.Lock()
+
+    def replay(self, data: Any) -> Tuple[bool, Any]:
+        """Rerun a dead letter; returns (ok, result or error) and never
+        feeds the dead-letter queue itself."""
+        with self.lock or contextlib.nullcontext():
+            result: Any = data
+            for stage in self.stages:
+                try:
+                    result = stage.process(result)
+                except Exception as e:
+                    return False, f"{type(e).__name__}: {e}"
+            self.stats["processed"] += 1
+            return True, result
+
+    def compile(self) -> Callable[[Any], Any]:
+        """Fuse the stages into one callable used by run_pipeline.
+
+        Adjacent InputStage/TransformStage/OutputStage runs become a
+        single function; any other stage keeps its own process call and
+        its own error handling. add_stage() drops the compiled form.
+        """
+        steps: List[Tuple[str, Callable[[Any], Any]]] = _fuse_stages(
+            self.stages)
+        stats: Dict[str, Union[str, int, float]] = self.stats
+        fail: Callable[[str, Any, Exception], Any] = self._record_failure
+
+        def run_single(data: Any) -> Any:
+            try:
+                result: Any = step(data)
+            except Exception as e:
+                return fail(step_name, data, e)
+            stats["processed"] += 1
+            return result
+
+        def run_steps(data: Any) -> Any:
+            result: Any = data
+            for name, process in steps:
+                try:
+                    result = process(result)
+                except Exception as e:
+                    return fail(name, data, e)
+            stats["processed"] += 1
+            return result
+
+        if len(steps) == 1:
+            step_name, step = steps[0]
+            self.compiled = run_single
+        else:
+            self.compiled = run_steps
+        return self.compiled
 
     def run_pipeline(self, data: Any) -> Any:
         """Run data through all stages sequentially."""
+        if self.lock is not None:
+            return self._run_locked(data)
+        if self.stage_profiles is not None or self.result_cache is not None:
+            return self._run_instrumented(data)
+        if self.compiled is not None:
+            return self.compiled(data)
         result: Any = data
         for stage in self.stages:
             try:
                 result = stage.process(result)
             except Exception as e:
-                self.stats["errors"] += 1
-                return {"status": "error", "error": str(e)}
+                return self._record_failure(type(stage).__name__, data, e)
         self.stats["processed"] += 1
         return result
 
+    def _record_failure(self, stage_name: str, data: Any,
+                        error: Exception) -> Dict[str, Any]:
+        """Count a failed record and hand it to the dead-letter queue."""
+        self.stats["errors"] += 1
+        if self.dead_letters is not None:
+            self.dead_letters.put({
+                "pipeline_id": self.pipeline_id, "stage": stage_name,
+                "error": f"{type(error).__name__}: {error}", "data": data,
+                "attempts": 0, "failed_at": time.time()
+            })
+        return {"status": "error", "error": str(error)}
+
+    def _run_locked(self, data: Any) -> Any:
+        """run_pipeline under the pipeline lock."""
+        with self.lock:
+            if (self.compiled is not None and self.stage_profiles is None
+                    and self.result_cache is None):
+                return self.compiled(data)
+            return self._run_instrumented(data)
+
+    def _run_instrumented(self, data: Any) -> Any:
+        """run_pipeline with stage profiling and/or result caching."""
+        clock: Callable[[], int] = time.perf_counter_ns
+        profiles: Optional[List[LatencyHistogram]] = self.stage_profiles
+        cache: Optional[ResultCache] = self.result_cache
+        result: Any = data
+        for index, stage in enumerate(self.stages):
+            start: int = clock()
+            try:
+                if cache is not None and getattr(stage, "pure", False):
+                    result = cache.call(index, stage.process, result)
+                else:
+                    result = stage.process(result)
+            except Exception as e:
+                if profiles is not None:
+                    profiles[index].record(clock() - start)
+                return self._record_failure(type(stage).__name__, data, e)
+            if profiles is not None:
+                profiles[index].record(clock() - start)
+        self.stats["processed"] += 1
+        return result
+
+    def run_batch(self, records: List[Any]) -> List[Any]:
+        """Run a list of records through all stages, one stage at a time.
+
+        Runs of built-in stages go through the same fused callable as
+        compile(), one list comprehension per run, with the run's time
+        split evenly over its stages' counters. Other stages exposing
+        process_batch get the whole batch in one call; stages declaring
+        io_bound = True are fanned out over a thread pool; the others run
+        record by record. When process_batch raises, the stage is re-run
+        record by record on the same records, so a stage with
+        process_batch must be idempotent. A process_batch returning the
+        wrong number of results fails the whole batch at that stage. A
+        failing record becomes an error dict and skips later stages.
+        Output order always matches input order.
+        """
+        if self.lock is not None:
+            with self.lock:
+                return self._run_batch(records)
+        return self._run_batch(records)
+
+    def _run_batch(self, records: List[Any]) -> List[Any]:
+        results: List[Any] = list(records)
+        alive: List[int] = list(range(len(results)))
+        for first, end, fused in _fused_spans(self.stages):
+            if not alive:
+                break
+            stage: ProcessingStage = self.stages[first]
+            counters: Dict[str, Union[str, int, float]] = self.stage_stats[
+                first]
+            start: float = time.perf_counter()
+            count: int = len(alive)
+            batch: List[Any] = (results if count == len(results)
+                                else [results[i] for i in alive])
+            outputs: Optional[List[Any]] = None
+            if fused is not None:
+                outputs = [fused(item) for item in batch]
+                if count == len(results):
+                    results = outputs
+                else:
+                    for i, value in zip(alive, outputs):
+                        results[i] = value
+                share: float = (time.perf_counter() - start) / (end - first)
+                for counters in self.stage_stats[first:end]:
+                    counters["records"] += count
+                    counters["seconds"] += share
+                continue
+            batch_process = getattr(stage, "process_batch", None)
+            if getattr(stage, "io_bound", False):
+                survivors: List[int] = []
+                outcomes = self._run_io_bound(stage, counters, batch)
+                for i, (ok, value) in zip(alive, outcomes):
+                    if ok:
+                        results[i] = value
+                        survivors.append(i)
+                    else:
+                        results[i] = self._record_failure(
+                            str(counters["stage"]), records[i], value)
+                alive = survivors
+                counters["records"] += count
+                counters["seconds"] += time.perf_counter() - start
+                continue
+            if batch_process is not None:
+                try:
+                    outputs = batch_process(batch)
+                except Exception:
+                    outputs = None
+                if outputs is not None and len(outputs) != count:
+                    error: ValueError = ValueError(
+                        f"process_batch returned {len(outputs)} results "
+                        f"for {count} records")
+                    for i in alive:
+                        results[i] = self._record_failure(
+                            str(counters["stage"]), records[i], error)
+                    alive = []
+                    counters["records"] += count
+                    counters["seconds"] += time.perf_counter() - start
+                    break
+            if outputs is None:
+                survivors = []
+                for i in alive:
+                    try:
+                        results[i] = stage.process(results[i])
+                        survivors.append(i)
+                    except Exception as e:
+                        results[i] = self._record_failure(
+                            str(counters["stage"]), records[i], e)
+                alive = survivors
+            elif count == len(results):
+                results = list(outputs)
+            else:
+                for i, value in zip(alive, outputs):
+                    results[i] = value
+            counters["records"] += count
+            counters["seconds"] += time.perf_counter() - start
+        self.stats["processed"] += len(alive)
+        return results
+
+    def _run_io_bound(self, stage: ProcessingStage,
+                      counters: Dict[str, Union[str, int, float]],
+                      batch: List[Any]) -> List[Tuple[bool, Any]]:
+        """Run stage.process over a thread pool, collecting in order.
+
+        At most 4 * concurrency records are in flight; queue_depth is
+        the number submitted but not yet collected.
+        """
+        # io_bound may have been set after add_stage created the counters
+        counters.setdefault("queue_depth", 0)
+        counters.setdefault("max_queue_depth", 0)
+        concurrency: int = int(getattr(stage, "concurrency", 4))
+        executor: Optional[ThreadPoolExecutor] = self.stage_executors.get(
+            id(stage))
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=concurrency,
+                thread_name_prefix=f"{self.pipeline_id}-{counters['stage']}")
+            self.stage_executors[id(stage)] = executor
+
+        def call(item: Any) -> Tuple[bool, Any]:
+            try:
+                return True, stage.process(item)
+            except Exception as e:
+                return False, e
+
+        window: int = concurrency * 4
+        pending: deque = deque()
+        outcomes: List[Tuple[bool, Any]] = []
+        for item in batch:
+            pending.append(executor.submit(call, item))
+            if len(pending) >= window:
+                counters["queue_depth"] = len(pending)
+                counters["max_queue_depth"] = max(
+                    int(counters["max_queue_depth"]), len(pending))
+                outcomes.append(pending.popleft().result())
+        while pending:
+            counters["queue_depth"] = len(pending)
+            counters["max_queue_depth"] = max(
+                int(counters["max_queue_depth"]), len(pending))
+            outcomes.append(pending.popleft().result())
+        counters["queue_depth"] = 0
+        return outcomes
+
+    def close(self) -> None:
+        """Shut down the thread pools of io_bound stages."""
+        for executor in self.stage_executors.values():
+            executor.shutdown()
+        self.stage_executors = {}
+
+    def _run_columns(self, batch: RecordBatch
+                     ) -> Union[RecordBatch, List[Any]]:
+        """Columns through the stages with process_columns; from the
+        first stage without it, the tail's run_batch records as-is."""
+        with self.lock or contextlib.nullcontext():
+            for index, (stage, counters) in enumerate(
+                    zip(self.stages, self.stage_stats)):
+                process_columns = _columns_method(stage)
+                if process_columns is None:
+                    rest: ProcessingPipeline = _StagePipeline(
+                        self, self.stages[index:], self.stage_stats[index:])
+                    records: List[Any] = (
+                        [batch.row(i) for i in range(len(batch))] if not index
+                        else batch.to_records())
+                    return rest.run_batch(records)
+                start: float = time.perf_counter()
+                batch = process_columns(batch)
+                counters["records"] += len(batch)
+                counters["seconds"] += time.perf_counter() - start
+            self.stats["processed"] += len(batch) - len(batch.errors)
+            return batch
+
+    def run_columns(self, batch: RecordBatch) -> RecordBatch:
+        """Run a columnar batch through all stages.
+
+        Stages with process_columns work on whole columns; from the first
+        stage without it, rows go back to dicts and run through run_batch.
+        Their output becomes columns again only if every record is still
+        a {"status", "data": dict} record; otherwise ValueError is raised
+        (use run_columnar to get such records back as they are).
+        """
+        result: Union[RecordBatch, List[Any]] = self._run_columns(batch)
+        if isinstance(result, RecordBatch):
+            return result
+        return RecordBatch.from_wrapped(result)
+
+    def run_columnar(self, records: List[Dict[str, Any]]) -> List[Any]:
+        """Dict records in, records out, columns in between."""
+        if not self.stages or _columns_method(self.stages[0]) is None:
+            return self.run_batch(records)
+        result: Union[RecordBatch, List[Any]] = self._run_columns(
+            RecordBatch.from_records(records))
+        if isinstance(result, RecordBatch):
+            return result.to_records()
+        return result
+
+    def get_stage_stats(self) -> List[Dict[str, Union[str, int, float]]]:
+        """Per-stage counters from run_batch, with records/sec."""
+        report: List[Dict[str, Union[str, int, float]]] = []
+        for counters in self.stage_stats:
+            seconds: float = float(counters["seconds"])
+            rate: float = counters["records"] / seconds if seconds else 0.0
+            report.append({**counters, "records_per_sec": rate})
+        return report
+
     @abstractmethod
     def process(self, data: Any) -> Union[str, Any]:
         """Process data - must be overridden by subclasses."""
         pass
 
     def get_stats(self) -> Dict[str, Union[str, int, float]]:
-        return {
+        stats: Dict[str, Union[str, int, float]] = {
             "pipeline_id": self.pipeline_id,
             **self.stats
         }
+        if self.stage_profiles is not None:
+            stats.update(profile_stats(
+                [str(c["stage"]) for c in self.stage_stats],
+                self.stage_profiles))
+        if self.result_cache is not None:
+            stats.update(self.result_cache.get_stats())
+        return stats
+
+
+class DeadLetterReplayer:
+    """Background thread replaying a pipeline's dead letters.
+
+    Entries are pulled from the queue, scheduled by the retry policy
+    and rerun with pipeline.replay(), so failures never block the
+    thread that produced them. start() turns on the pipeline's lock, so
+    replays never interleave with the owner's runs. on_recovered(entry,
+    result) is called for every record that finally goes through.
+    """
+
+    def __init__(self, pipeline: ProcessingPipeline, policy: RetryPolicy,
+                 on_recovered: Optional[Callable[[Dict[str, Any], Any],
+                                                 None]] = None,
+                 max_scheduled: int = 1000, poll_interval: float = 0.05):
+        if pipeline.dead_letters is None:
+            pipeline.attach_dead_letters(DeadLetterQueue())
+        self.pipeline: ProcessingPipeline = pipeline
+        self.queue: DeadLetterQueue = pipeline.dead_letters
+        self.policy: RetryPolicy = policy
+        self.on_recovered = on_recovered
+        self.max_scheduled: int = max_scheduled
+        self.poll_interval: float = poll_interval
+        self.scheduled: List[Tuple[float, int, Dict[str, Any]]] = []
+        self.sequence: int = 0
+        self.stop_event: threading.Event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+        self.stats: Dict[str, Union[str, int, float]] = {
+            "retried": 0, "recovered": 0, "parked": 0
+        }
+
+    def start(self) -> None:
+        if self.thread is None:
+            self.stop_event.clear()
+            self.pipeline.enable_locking()
+            self.thread = threading.Thread(target=self._run,
+                                           name="nexus-replayer",
+                                           daemon=True)
+            self.thread.start()
+
+    def stop(self) -> None:
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def _schedule(self, entry: Dict[str, Any]) -> None:
+        wait: Optional[float] = self.policy.delay(int(entry["attempts"]))
+        if wait is None:
+            self.queue.park(entry)
+            self.stats["parked"] += 1
+            return
+        self.sequence += 1
+        heapq.heappush(self.scheduled,
+                       (time.monotonic() + wait, self.sequence, entry))
+
+    def run_once(self) -> None:
+        """Pull new dead letters and retry the ones that are due."""
+        while len(self.scheduled) < self.max_scheduled:
+            entry: Optional[Dict[str, Any]] = self.queue.get()
+            if entry is None:
+                break
+            self._schedule(entry)
+        now: float = time.monotonic()
+        while self.scheduled and self.scheduled[0][0] <= now:
+            _, _, entry = heapq.heappop(self.scheduled)
+            entry["attempts"] = int(entry["attempts"]) + 1
+            self.stats["retried"] += 1
+            ok, outcome = self.pipeline.replay(entry["data"])
+            if ok:
+                self.stats["recovered"] += 1
+                if self.on_recovered is not None:
+                    self.on_recovered(entry, outcome)
+            else:
+                entry["error"] = outcome
+                self._schedule(entry)
+
+    def _run(self) -> None:
+        while not self.stop_event.is_set():
+            self.run_once()
+            wait: float = self.poll_interval
+            if self.scheduled:
+                wait = min(wait, max(self.scheduled[0][0]
+                                     - time.monotonic(), 0.0))
+            self.stop_event.wait(wait)
+
+    def get_stats(self) -> Dict[str, Union[str, int, float]]:
+        return {**self.stats, "scheduled": len(self.scheduled),
+                **self.queue.get_stats()}
+
+
+def _columns_method(stage: Any
+                    ) -> Optional[Callable[[RecordBatch], RecordBatch]]:
+    """stage.process_columns, unless a codec means it must see bytes."""
+    if getattr(stage, "codec", None) is not None:
+        return None
+    return getattr(stage, "process_columns", None)
+
+
+class _StagePipeline(ProcessingPipeline):
+    """Runs the tail of another pipeline's stages, sharing its counters."""
+
+    def __init__(self, owner: ProcessingPipeline,
+                 stages: List[ProcessingStage],
+                 stage_stats: List[Dict[str, Union[str, int, float]]]):
+        super().__init__(owner.pipeline_id)
+        self.stages = list(stages)
+        self.stage_stats = list(stage_stats)
+        self.stats = owner.stats
+        self.dead_letters = owner.dead_letters
+        self.stage_executors = owner.stage_executors
+
+    def process(self, data: Any) -> Union[str, Any]:
+        return self.run_pipeline(data)
 
 
 class JSONAdapter(ProcessingPipeline):
-    """Pipeline adapter for JSON data."""
+    """Pipeline adapter for JSON data.
 
-    def __init__(self, pipeline_id: str):
+    With a codec, encoded messages are decoded on input and delivered
+    records are encoded on output.
+    """
+
+    def __init__(self, pipeline_id: str, codec: Optional[Codec] = None):
         super().__init__(pipeline_id)
-        self.add_stage(InputStage())
+        self.add_stage(InputStage(codec))
         self.add_stage(TransformStage())
-        self.add_stage(OutputStage())
+        self.add_stage(OutputStage(codec))
 
     def process(self, data: Any) -> Union[str, Any]:
         try:
@@ -112,6 +1333,81 @@ class JSONAdapter(ProcessingPipeline):
             return f"JSON processing error: {e}"
 
 
+CSV_CHUNK_SIZE: int = 1 << 16
+
+
+def is_csv_source(data: Any) -> bool:
+    """True for file objects and byte buffers (bytes, memoryview, mmap)."""
+    return hasattr(data, "read") or isinstance(
+        data, (bytes, bytearray, memoryview))
+
+
+def iter_chunks(source: Any,
+                chunk_size: int = CSV_CHUNK_SIZE) -> Iterator[Any]:
+    """Yield chunk_size pieces of a file object or buffer.
+
+    Buffers are sliced through a memoryview, so only one chunk is ever
+    copied at a time.
+    """
+    try:
+        buffer: memoryview = memoryview(source)
+    except TypeError:
+        while True:
+            chunk: Any = source.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    with buffer, buffer.cast("B") as view:
+        for start in range(0, len(view), chunk_size):
+            yield view[start:start + chunk_size].tobytes()
+
+
+def iter_lines(source: Any,
+               chunk_size: int = CSV_CHUNK_SIZE) -> Iterator[str]:
+    """Lazily yield the text lines of a CSV source."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    tail: str = ""
+    for chunk in iter_chunks(source, chunk_size):
+        text: str = (decoder.decode(chunk) if isinstance(chunk, bytes)
+                     else chunk)
+        lines: List[str] = (tail + text).split("\n")
+        tail = lines.pop()
+        for line in lines:
+            yield line.rstrip("\r")
+    tail += decoder.decode(b"", final=True)
+    if tail:
+        yield tail.rstrip("\r")
+
+
+def iter_csv_rows(source: Any,
+                  chunk_size: int = CSV_CHUNK_SIZE) -> Iterator[List[str]]:
+    """Lazily yield parsed CSV rows, skipping blank lines."""
+    for row in csv.reader(line for line in iter_lines(source, chunk_size)
+                          if line.strip()):
+        yield row
+
+
+def count_csv_rows(source: Any, chunk_size: int = CSV_CHUNK_SIZE) -> int:
+    """Count rows like len(data.strip().split("\\n")), chunk by chunk."""
+    rows: int = 0
+    pending: int = 0
+    started: bool = False
+    for chunk in iter_chunks(source, chunk_size):
+        newline: Any = b"\n" if isinstance(chunk, bytes) else "\n"
+        if not started:
+            chunk = chunk.lstrip()
+            if not chunk:
+                continue
+            started = True
+        body: Any = chunk.rstrip()
+        if not body:
+            pending += chunk.count(newline)
+            continue
+        rows += pending + body.count(newline)
+        pending = chunk.count(newline, len(body))
+    return rows + 1
+
+
 class CSVAdapter(ProcessingPipeline):
     """Pipeline adapter for CSV data."""
 
@@ -129,11 +1425,75 @@ class CSVAdapter(ProcessingPipeline):
                 actions: int = max(len(rows) - 1, 1)
                 return (f"User activity logged: "
                         f"{actions} actions processed")
+            if is_csv_source(data):
+                return self.process_stream(data)
             return self.run_pipeline(data)
         except Exception as e:
             self.stats["errors"] += 1
             return f"CSV processing error: {e}"
 
+    def process_stream(self, source: Any,
+                       chunk_size: int = CSV_CHUNK_SIZE) -> str:
+        """Count actions in a file object or buffer without loading it."""
+        row_count: int = count_csv_rows(source, chunk_size)
+        actions: int = max(row_count - 1, 1)
+        self.run_pipeline({"rows": row_count, "actions": actions})
+        return f"User activity logged: {actions} actions processed"
+
+    def stream_rows(self, source: Any,
+                    chunk_size: int = CSV_CHUNK_SIZE) -> Iterator[List[str]]:
+        return iter_csv_rows(source, chunk_size)
+
+
+def is_numeric_buffer(data: Any) -> bool:
+    """True for array.array, memoryview and NumPy arrays."""
+    if isinstance(data, (array.array, memoryview)):
+        return True
+    return np is not None and isinstance(data, np.ndarray)
+
+
+READING_CHUNK: int = 1 << 16
+
+
+def summarize_readings(data: Any) -> Dict[str, float]:
+    """count/mean/min/max/stddev of a numeric buffer.
+
+    With NumPy the buffer is viewed in place and reduced in C; without
+    it the builtins do the work, and the variance pass only holds one
+    chunk of deviations from the mean at a time.
+    """
+    if np is not None:
+        values = np.asarray(data, dtype=np.float64).ravel()
+        count: int = int(values.size)
+        if not count:
+            return {"count": 0, "mean": 0.0, "min": 0.0, "max": 0.0,
+                    "stddev": 0.0}
+        return {"count": count, "mean": float(values.mean()),
+                "min": float(values.min()), "max": float(values.max()),
+                "stddev": float(values.std())}
+    if isinstance(data, memoryview) and data.ndim != 1:
+        data = data.cast("B").cast(data.format)
+    count = len(data)
+    if not count:
+        return {"count": 0, "mean": 0.0, "min": 0.0, "max": 0.0,
+                "stddev": 0.0}
+    mean: float = math.fsum(data) / count
+    # second pass around the mean (E[x^2] - mean^2 cancels badly when
+    # the mean is large next to the spread), a chunk at a time so only
+    # READING_CHUNK deviations exist at once
+    shifts: List[float] = []
+    squares: List[float] = []
+    for start in range(0, count, READING_CHUNK):
+        deltas: List[float] = list(map(
+            operator.sub, data[start:start + READING_CHUNK],
+            itertools.repeat(mean)))
+        shifts.append(math.fsum(deltas))
+        squares.append(math.fsum(map(operator.mul, deltas, deltas)))
+    shift: float = math.fsum(shifts) / count
+    variance: float = max(math.fsum(squares) / count - shift * shift, 0.0)
+    return {"count": count, "mean": mean, "min": float(min(data)),
+            "max": float(max(data)), "stddev": math.sqrt(variance)}
+
 
 class StreamAdapter(ProcessingPipeline):
     """Pipeline adapter for real-time stream data."""
@@ -155,12 +1515,29 @@ class StreamAdapter(ProcessingPipeline):
                 avg: float = sum(readings) / count if count else 0
                 return (f"Stream summary: {count} readings, "
                         f"avg: {avg}°C")
+            if is_numeric_buffer(data):
+                summary: Dict[str, float] = summarize_readings(data)
+                self.run_pipeline(summary)
+                return (f"Stream summary: {summary['count']} readings, "
+                        f"avg: {summary['mean']}°C, "
+                        f"min: {summary['min']}°C, "
+                        f"max: {summary['max']}°C, "
+                        f"stddev: {summary['stddev']:.3f}")
             return self.run_pipeline(data)
         except Exception as e:
             self.stats["errors"] += 1
             return f"Stream processing error: {e}"
 
 
+def _iter_file_lines(source: Any) -> Iterator[Any]:
+    """readline() loop, so tell() stays usable on text files."""
+    while True:
+        line: Any = source.readline()
+        if not line:
+            return
+        yield line.rstrip(b"\r\n" if isinstance(line, bytes) else "\r\n")
+
+
 class NexusManager:
     """Orchestrates multiple pipelines polymorphically."""
 
@@ -189,11 +1566,901 @@ class NexusManager:
                 return f"Chain error at {pid}: {e}"
         return result
 
+    def chain_stream(self, records: Iterable[Any],
+                     pipeline_ids: List[str]) -> Iterator[Any]:
+        """Lazily chain each record through every pipeline in turn.
+
+        Records are pulled one at a time and leave pipeline C before the
+        next one enters pipeline A, so memory does not grow with input.
+        """
+        for data in records:
+            yield self.chain(data, pipeline_ids)
+
+    def save_checkpoint(self, path: str, offset: int,
+                        pipeline_ids: List[str],
+                        position: Optional[int] = None,
+                        complete: bool = False) -> None:
+        """Atomically write input offset and pipeline stats to path."""
+        checkpoint: Dict[str, Any] = {
+            "offset": offset, "position": position,
+            "pipeline_ids": pipeline_ids, "complete": complete,
+            "saved_at": time.time(),
+            "stats": {pid: dict(self.pipelines[pid].stats)
+                      for pid in pipeline_ids if pid in self.pipelines}
+        }
+        tmp_path: str = f"{path}.tmp"
+        with open(tmp_path, "w") as tmp:
+            json.dump(checkpoint, tmp)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def load_checkpoint(path: str) -> Dict[str, Any]:
+        with open(path) as saved:
+            return json.load(saved)
+
+    def chain_checkpointed(self, source: Any, pipeline_ids: List[str],
+                           checkpoint_path: str, every: int = 10_000,
+                           checkpoint: Optional[Dict[str, Any]] = None
+                           ) -> Iterator[Any]:
+        """chain_stream that checkpoints progress every `every` records.
+
+        source is any iterable, or a file object read line by line; for
+        files the checkpoint also stores the byte position, so a resume
+        seeks straight to it instead of re-reading skipped lines. Records
+        still stream one at a time; checkpoints are written between
+        blocks rather than tested for on every record.
+        """
+        offset: int = int(checkpoint["offset"]) if checkpoint else 0
+        position: Optional[int] = (checkpoint.get("position")
+                                   if checkpoint else None)
+        is_file: bool = hasattr(source, "readline")
+        records: Iterator[Any]
+        if is_file:
+            if position is not None:
+                source.seek(position)
+            else:
+                for _ in range(offset):
+                    source.readline()
+            records = _iter_file_lines(source)
+        elif offset:
+            records = itertools.islice(iter(source), offset, None)
+        else:
+            records = iter(source)
+        while True:
+            # blocks up to the next multiple of every; zip pulls the range
+            # first, so it stops without consuming a record past the block
+            start: int = offset
+            block: range = range(offset + 1, offset - offset % every
+                                 + every + 1)
+            for offset, data in zip(block, records):
+                yield self.chain(data, pipeline_ids)
+            if offset == start or offset % every:
+                break
+            self.save_checkpoint(checkpoint_path, offset, pipeline_ids,
+                                 source.tell() if is_file else None)
+        self.save_checkpoint(checkpoint_path, offset, pipeline_ids,
+                             source.tell() if is_file else None,
+                             complete=True)
+
+    def resume(self, checkpoint_path: str, source: Any,
+               every: int = 10_000) -> Iterator[Any]:
+        """Restore stats from a checkpoint and continue after its offset."""
+        checkpoint: Dict[str, Any] = self.load_checkpoint(checkpoint_path)
+        for pid, stats in checkpoint["stats"].items():
+            if pid in self.pipelines:
+                self.pipelines[pid].stats.update(stats)
+        return self.chain_checkpointed(source, checkpoint["pipeline_ids"],
+                                       checkpoint_path, every, checkpoint)
+
+    def enable_profiling(self) -> None:
+        for pipeline in self.pipelines.values():
+            pipeline.enable_profiling()
+
+    def disable_profiling(self) -> None:
+        for pipeline in self.pipelines.values():
+            pipeline.disable_profiling()
+
     def get_all_stats(self) -> List[Dict[str, Union[str, int, float]]]:
         return [p.get_stats() for p in self.pipelines.values()]
 
 
+_worker_manager: Optional[NexusManager] = None
+
+
+def _init_worker(pipelines: List[ProcessingPipeline]) -> None:
+    """Build the shard-local manager inside a worker process."""
+    global _worker_manager
+    _worker_manager = NexusManager()
+    for pipeline in pipelines:
+        _worker_manager.register(pipeline)
+
+
+def _worker_register(pipeline: ProcessingPipeline) -> None:
+    if _worker_manager is not None:
+        _worker_manager.register(pipeline)
+
+
+def _worker_set_profiling(enabled: bool) -> None:
+    if _worker_manager is None:
+        return
+    if enabled:
+        _worker_manager.enable_profiling()
+    else:
+        _worker_manager.disable_profiling()
+
+
+def _worker_process(items: List[Tuple[str, Any]]) -> List[Any]:
+    if _worker_manager is None:
+        return ["Worker not initialized" for _ in items]
+    return [_worker_manager.process(pid, data) for pid, data in items]
+
+
+def _worker_chain(records: List[Any], pipeline_ids: List[str]) -> List[Any]:
+    if _worker_manager is None:
+        return ["Worker not initialized" for _ in records]
+    return [_worker_manager.chain(data, pipeline_ids) for data in records]
+
+
+def _worker_stats() -> List[Dict[str, Union[str, int, float]]]:
+    if _worker_manager is None:
+        return []
+    return _worker_manager.get_all_stats()
+
+
+def _worker_profiles() -> Dict[str, List[LatencyHistogram]]:
+    if _worker_manager is None:
+        return {}
+    return {pid: pipeline.stage_profiles
+            for pid, pipeline in _worker_manager.pipelines.items()
+            if pipeline.stage_profiles is not None}
+
+
+class ParallelNexusManager(NexusManager):
+    """Shards records across worker processes, one core per shard.
+
+    Every shard is a single-process executor holding its own copy of
+    the registered pipelines, so records routed to the same shard run
+    in submission order. Records are routed by pipeline id, or by
+    key(pipeline_id, data) when a key function is given. chain_many
+    without a key spreads its chunks over all shards round-robin, so
+    chained records have no ordering guarantee between chunks.
+    Shard stats are collected on shutdown() and kept in get_all_stats().
+    """
+
+    def __init__(self, workers: Optional[int] = None,
+                 key: Optional[Callable[[str, Any], Hashable]] = None,
+                 chunk_size: int = 1000):
+        super().__init__()
+        self.workers: int = workers or os.cpu_count() or 1
+        self.key: Optional[Callable[[str, Any], Hashable]] = key
+        self.chunk_size: int = chunk_size
+        self.shards: List[ProcessPoolExecutor] = []
+        self.retired_rows: List[Dict[str, Union[str, int, float]]] = []
+        self.retired_profiles: Dict[str, List[LatencyHistogram]] = {}
+
+    def start(self) -> None:
+        if self.shards:
+            return
+        pipelines: List[ProcessingPipeline] = list(self.pipelines.values())
+        self.shards = [
+            ProcessPoolExecutor(max_workers=1, initializer=_init_worker,
+                                initargs=(pipelines,))
+            for _ in range(self.workers)
+        ]
+
+    def shutdown(self) -> None:
+        """Stop the shards, keeping their stats for get_all_stats()."""
+        if self.shards:
+            rows: List[Dict[str, Union[str, int, float]]] = (
+                self.get_all_stats())
+            self.retired_profiles = self._collect_profiles()
+            self.retired_rows = rows
+        for shard in self.shards:
+            shard.shutdown()
+        self.shards = []
+
+    def __enter__(self) -> "ParallelNexusManager":
+        self.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.shutdown()
+
+    def register(self, pipeline: ProcessingPipeline) -> None:
+        super().register(pipeline)
+        for shard in self.shards:
+            shard.submit(_worker_register, pipeline).result()
+
+    def enable_profiling(self) -> None:
+        """Profile the parent's pipelines and every live shard's copy."""
+        super().enable_profiling()
+        self._set_shard_profiling(True)
+
+    def disable_profiling(self) -> None:
+        super().disable_profiling()
+        self._set_shard_profiling(False)
+
+    def _set_shard_profiling(self, enabled: bool) -> None:
+        futures: List[Future] = [shard.submit(_worker_set_profiling, enabled)
+                                 for shard in self.shards]
+        for future in futures:
+            future.result()
+
+    def shard_for(self, pipeline_id: str, data: Any) -> int:
+        routing_key: Hashable = (self.key(pipeline_id, data) if self.key
+                                 else pipeline_id)
+        return hash(routing_key) % self.workers
+
+    def process(self, pipeline_id: str, data: Any) -> Union[str, Any]:
+        return self.map([(pipeline_id, data)])[0]
+
+    def process_many(self, pipeline_id: str,
+                     records: List[Any]) -> List[Any]:
+        return self.map([(pipeline_id, data) for data in records])
+
+    def map(self, items: List[Tuple[str, Any]]) -> List[Any]:
+        """Process (pipeline_id, data) pairs; results keep input order."""
+        self.start()
+        routed: List[List[int]] = [[] for _ in range(self.workers)]
+        for index, (pid, data) in enumerate(items):
+            if pid not in self.pipelines:
+                continue
+            routed[self.shard_for(pid, data)].append(index)
+        results: List[Any] = [f"Pipeline {pid} not found"
+                              for pid, _ in items]
+        pending: List[Tuple[List[int], Future]] = []
+        for shard, indexes in zip(self.shards, routed):
+            for start in range(0, len(indexes), self.chunk_size):
+                chunk: List[int] = indexes[start:start + self.chunk_size]
+                future: Future = shard.submit(
+                    _worker_process, [items[i] for i in chunk])
+                pending.append((chunk, future))
+        for chunk, future in pending:
+            try:
+                for i, value in zip(chunk, future.result()):
+                    results[i] = value
+            except Exception as e:
+                for i in chunk:
+                    results[i] = f"Manager error: {e}"
+        return results
+
+    def chain(self, data: Any,
+              pipeline_ids: List[str]) -> Union[str, Any]:
+        return self.chain_many([data], pipeline_ids)[0]
+
+    def chain_many(self, records: List[Any],
+                   pipeline_ids: List[str]) -> List[Any]:
+        """Chain every record through pipeline_ids inside its shard."""
+        self.start()
+        first: str = pipeline_ids[0] if pipeline_ids else ""
+        chunks: List[Tuple[int, List[int]]] = []
+        if self.key is None:
+            # a pipeline-id route would send every record to one shard
+            for number, start in enumerate(
+                    range(0, len(records), self.chunk_size)):
+                chunks.append((number % self.workers,
+                               list(range(start, min(
+                                   start + self.chunk_size,
+                                   len(records))))))
+        else:
+            routed: List[List[int]] = [[] for _ in range(self.workers)]
+            for index, data in enumerate(records):
+                routed[self.shard_for(first, data)].append(index)
+            for shard_index, indexes in enumerate(routed):
+                for start in range(0, len(indexes), self.chunk_size):
+                    chunks.append((shard_index,
+                                   indexes[start:start + self.chunk_size]))
+        results: List[Any] = list(records)
+        pending: List[Tuple[List[int], Future]] = []
+        for shard_index, chunk in chunks:
+            future: Future = self.shards[shard_index].submit(
+                _worker_chain, [records[i] for i in chunk], pipeline_ids)
+            pending.append((chunk, future))
+        for chunk, future in pending:
+            try:
+                for i, value in zip(chunk, future.result()):
+                    results[i] = value
+            except Exception as e:
+                for i in chunk:
+                    results[i] = f"Chain error: {e}"
+        return results
+
+    def get_all_stats(self) -> List[Dict[str, Union[str, int, float]]]:
+        """Merge every shard's get_stats() into one row per pipeline,
+        including the shards stopped by earlier shutdown() calls."""
+        if not self.shards and not self.retired_rows:
+            return super().get_all_stats()
+        merged: OrderedDict[str, Dict[str, Union[str, int, float]]] = (
+            OrderedDict((pid, {"pipeline_id": pid, "processed": 0,
+                               "errors": 0})
+                        for pid in self.pipelines))
+        futures: List[Future] = [shard.submit(_worker_stats)
+                                 for shard in self.shards]
+        for rows in [self.retired_rows, *(f.result() for f in futures)]:
+            for row in rows:
+                target = merged.setdefault(
+                    str(row["pipeline_id"]),
+                    {"pipeline_id": row["pipeline_id"]})
+                for name, value in row.items():
+                    if name == "pipeline_id":
+                        continue
+                    if isinstance(value, (int, float)):
+                        target[name] = target.get(name, 0) + value
+                    else:
+                        target[name] = value
+        self._merge_profiles(merged)
+        return list(merged.values())
+
+    def _collect_profiles(self) -> Dict[str, List[LatencyHistogram]]:
+        """Stage histograms summed over live and retired shards."""
+        combined: Dict[str, List[LatencyHistogram]] = {}
+        futures: List[Future] = [shard.submit(_worker_profiles)
+                                 for shard in self.shards]
+        for profiles_by_pid in [self.retired_profiles,
+                                *(f.result() for f in futures)]:
+            for pid, profiles in profiles_by_pid.items():
+                if pid not in combined:
+                    combined[pid] = [LatencyHistogram() for _ in profiles]
+                for total, histogram in zip(combined[pid], profiles):
+                    total.merge(histogram)
+        return combined
+
+    def _merge_profiles(
+            self,
+            merged: Dict[str, Dict[str, Union[str, int, float]]]) -> None:
+        """Percentiles cannot be summed: recompute them from histograms."""
+        combined: Dict[str, List[LatencyHistogram]] = (
+            self._collect_profiles())
+        for pid, profiles in combined.items():
+            pipeline: Optional[ProcessingPipeline] = self.pipelines.get(pid)
+            if pipeline is None or pid not in merged:
+                continue
+            merged[pid].update(profile_stats(
+                [str(c["stage"]) for c in pipeline.stage_stats], profiles))
+
+
+class AsyncNexusManager(NexusManager):
+    """asyncio front-end: bounded per-pipeline queues with backpressure.
+
+    submit() waits while the pipeline queue is full, then returns a
+    future for the result. Worker tasks pull from each queue and run
+    the synchronous pipeline in an executor so slow stages never block
+    the event loop. Unless an executor is passed in, each pipeline gets
+    its own pool sized to its concurrency. Pipelines mutate their stats
+    in process(), so calls to one pipeline are serialized by a lock
+    unless it declares thread_safe = True.
+    """
+
+    def __init__(self, queue_size: int = 1000, concurrency: int = 1,
+                 executor: Optional[Executor] = None):
+        super().__init__()
+        self.queue_size: int = queue_size
+        self.concurrency: int = concurrency
+        self.executor: Optional[Executor] = executor
+        self.owns_executor: bool = executor is None
+        self.pipeline_concurrency: Dict[str, int] = {}
+        self.executors: Dict[str, Executor] = {}
+        self.locks: Dict[str, threading.Lock] = {}
+        self.queues: Dict[str, asyncio.Queue] = {}
+        self.workers: Dict[str, List[asyncio.Task]] = {}
+
+    def register(self, pipeline: ProcessingPipeline,
+                 concurrency: Optional[int] = None) -> None:
+        super().register(pipeline)
+        self.pipeline_concurrency[pipeline.pipeline_id] = (
+            concurrency or self.concurrency)
+
+    def _queue_for(self, pipeline_id: str) -> asyncio.Queue:
+        queue: Optional[asyncio.Queue] = self.queues.get(pipeline_id)
+        if queue is not None:
+            return queue
+        self.executors[pipeline_id] = self.executor or ThreadPoolExecutor(
+            max_workers=self.pipeline_concurrency[pipeline_id],
+            thread_name_prefix=f"nexus-{pipeline_id}")
+        self.locks[pipeline_id] = threading.Lock()
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self.queues[pipeline_id] = queue
+        self.workers[pipeline_id] = [
+            asyncio.create_task(self._worker(pipeline_id, queue))
+            for _ in range(self.pipeline_concurrency[pipeline_id])
+        ]
+        return queue
+
+    async def _worker(self, pipeline_id: str, queue: asyncio.Queue) -> None:
+        loop = asyncio.get_running_loop()
+        pipeline: ProcessingPipeline = self.pipelines[pipeline_id]
+        executor: Executor = self.executors[pipeline_id]
+        lock: Optional[threading.Lock] = (
+            None if getattr(pipeline, "thread_safe", False)
+            else self.locks[pipeline_id])
+
+        def run(data: Any) -> Any:
+            if lock is None:
+                return pipeline.process(data)
+            with lock:
+                return pipeline.process(data)
+
+        while True:
+            data, future = await queue.get()
+            try:
+                result: Any = await loop.run_in_executor(executor, run,
+                                                         data)
+            except Exception as e:
+                result = f"Manager error: {e}"
+            if not future.done():
+                future.set_result(result)
+            queue.task_done()
+
+    async def submit(self, pipeline_id: str,
+                     data: Any) -> "asyncio.Future[Any]":
+        """Enqueue a record, waiting while the queue is full."""
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        if pipeline_id not in self.pipelines:
+            future.set_result(f"Pipeline {pipeline_id} not found")
+            return future
+        await self._queue_for(pipeline_id).put((data, future))
+        return future
+
+    async def process_async(self, pipeline_id: str,
+                            data: Any) -> Union[str, Any]:
+        return await (await self.submit(pipeline_id, data))
+
+    async def join(self) -> None:
+        """Wait until every queued record has been processed."""
+        for queue in list(self.queues.values()):
+            await queue.join()
+
+    async def close(self) -> None:
+        await self.join()
+        for tasks in self.workers.values():
+            for task in tasks:
+                task.cancel()
+        for tasks in self.workers.values():
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self.queues = {}
+        self.workers = {}
+        if self.owns_executor:
+            for executor in self.executors.values():
+                executor.shutdown()
+        self.executors = {}
+        self.locks = {}
+
+    def get_all_stats(self) -> List[Dict[str, Union[str, int, float]]]:
+        stats: List[Dict[str, Union[str, int, float]]] = (
+            super().get_all_stats())
+        for row in stats:
+            queue: Optional[asyncio.Queue] = self.queues.get(
+                str(row["pipeline_id"]))
+            row["queued"] = queue.qsize() if queue is not None else 0
+        return stats
+
+
+class MicroBatchScheduler:
+    """Buffers records per pipeline and flushes them through run_batch.
+
+    A buffer is flushed when it reaches max_batch records or when its
+    oldest record has waited max_delay seconds, whichever comes first.
+    Size flushes run in the submitting thread, deadline flushes on a
+    small thread pool; neither holds the scheduler lock while running.
+    submit() returns a Future resolved with the record's pipeline
+    output once its batch has been flushed.
+    """
+
+    def __init__(self, manager: NexusManager, max_batch: int = 100,
+                 max_delay: float = 0.01):
+        self.manager: NexusManager = manager
+        self.max_batch: int = max_batch
+        self.max_delay: float = max_delay
+        self.buffers: Dict[str, List[Tuple[float, Any, Future]]] = {}
+        self.condition: threading.Condition = threading.Condition()
+        self.pipeline_locks: Dict[str, threading.Lock] = {}
+        self.running: bool = False
+        self.thread: Optional[threading.Thread] = None
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.stats: Dict[str, Union[str, int, float]] = {
+            "batches": 0, "records": 0, "max_batch_size": 0,
+            "size_flushes": 0, "deadline_flushes": 0, "manual_flushes": 0
+        }
+        self.queue_delay: LatencyHistogram = LatencyHistogram()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self.running = True
+        self.executor = ThreadPoolExecutor(
+            thread_name_prefix="nexus-batch-runner")
+        self.thread = threading.Thread(target=self._watch_deadlines,
+                                       name="nexus-batcher", daemon=True)
+        self.thread.start()
+
+    def close(self) -> None:
+        """Flush everything still buffered and stop the deadline thread."""
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+        self.flush()
+
+    def __enter__(self) -> "MicroBatchScheduler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def submit(self, pipeline_id: str, data: Any) -> Future:
+        future: Future = Future()
+        if pipeline_id not in self.manager.pipelines:
+            future.set_result(f"Pipeline {pipeline_id} not found")
+            return future
+        batch: List[Tuple[float, Any, Future]] = []
+        with self.condition:
+            buffer = self.buffers.setdefault(pipeline_id, [])
+            buffer.append((time.monotonic(), data, future))
+            if len(buffer) >= self.max_batch:
+                batch = self._take_locked(pipeline_id, "size_flushes")
+            elif len(buffer) == 1:
+                self.condition.notify()
+        if batch:
+            self._run(pipeline_id, batch)
+        return future
+
+    def flush(self, pipeline_id: Optional[str] = None) -> None:
+        with self.condition:
+            due: List[Tuple[str, List[Tuple[float, Any, Future]]]] = [
+                (pid, self._take_locked(pid, "manual_flushes"))
+                for pid in ([pipeline_id] if pipeline_id else
+                            list(self.buffers))
+                if self.buffers.get(pid)]
+        for pid, batch in due:
+            self._run(pid, batch)
+
+    def _watch_deadlines(self) -> None:
+        while True:
+            with self.condition:
+                if not self.running:
+                    return
+                now: float = time.monotonic()
+                wait: Optional[float] = None
+                due: List[Tuple[str, List[Tuple[float, Any, Future]]]] = []
+                for pid, buffer in list(self.buffers.items()):
+                    if not buffer:
+                        continue
+                    remaining: float = buffer[0][0] + self.max_delay - now
+                    if remaining <= 0:
+                        due.append((pid, self._take_locked(
+                            pid, "deadline_flushes")))
+                    elif wait is None or remaining < wait:
+                        wait = remaining
+                if not due:
+                    self.condition.wait(wait)
+                    continue
+            # run on the pool so the watcher keeps meeting other
+            # pipelines' deadlines while a slow batch is in progress
+            for pid, batch in due:
+                self.executor.submit(self._run, pid, batch)
+
+    def _take_locked(self, pipeline_id: str,
+                     trigger: str) -> List[Tuple[float, Any, Future]]:
+        """Pop one buffer and count it; caller holds the lock."""
+        batch: List[Tuple[float, Any, Future]] = self.buffers.pop(
+            pipeline_id, [])
+        if not batch:
+            return batch
+        now: float = time.monotonic()
+        for enqueued, _, _ in batch:
+            self.queue_delay.record(int((now - enqueued) * 1e9))
+        self.pipeline_locks.setdefault(pipeline_id, threading.Lock())
+        self.stats["batches"] += 1
+        self.stats["records"] += len(batch)
+        self.stats[trigger] += 1
+        self.stats["max_batch_size"] = max(
+            int(self.stats["max_batch_size"]), len(batch))
+        return batch
+
+    def _run(self, pipeline_id: str,
+             batch: List[Tuple[float, Any, Future]]) -> None:
+        """Run a popped batch outside the scheduler lock, so one slow
+        batch never blocks submit() or other pipelines' flushes. Batches
+        of the same pipeline still run one at a time."""
+        with self.pipeline_locks[pipeline_id]:
+            try:
+                results: List[Any] = self.manager.pipelines[
+                    pipeline_id].run_batch([data for _, data, _ in batch])
+            except Exception as e:
+                results = [f"Manager error: {e}"] * len(batch)
+        for (_, _, future), result in zip(batch, results):
+            future.set_result(result)
+
+    def get_stats(self) -> Dict[str, Union[str, int, float]]:
+        """Achieved batch sizes and queueing delay, for tuning."""
+        batches: int = int(self.stats["batches"])
+        stats: Dict[str, Union[str, int, float]] = {
+            **self.stats,
+            "avg_batch_size": self.stats["records"] / batches
+            if batches else 0.0
+        }
+        for percent in PROFILE_PERCENTILES:
+            stats[f"queue_delay_p{percent}_us"] = (
+                self.queue_delay.percentile(percent) / 1e3)
+        return stats
+
+
+def benchmark_run_batch(n_records: int = 100_000, rounds: int = 5) -> None:
+    """Compare the per-record run_pipeline loop against run_batch.
+
+    The two alternate for a few rounds and each keeps its best time;
+    stage rates come from the batched pipeline of the best round.
+    """
+    print(f"--- run_pipeline loop vs run_batch ({n_records} records) ---")
+    loop_time: float = float("inf")
+    batch_time: float = float("inf")
+    batched: Optional[ProcessingPipeline] = None
+    for _ in range(rounds):
+        looped = JSONAdapter("bench_loop")
+        records: List[Any] = [
+            {"sensor": "temp", "value": float(i % 40), "unit": "C"}
+            for i in range(n_records)
+        ]
+        start: float = time.perf_counter()
+        for record in records:
+            looped.run_pipeline(record)
+        loop_time = min(loop_time, time.perf_counter() - start)
+
+        pipeline = JSONAdapter("bench_batch")
+        records = [
+            {"sensor": "temp", "value": float(i % 40), "unit": "C"}
+            for i in range(n_records)
+        ]
+        start = time.perf_counter()
+        pipeline.run_batch(records)
+        elapsed: float = time.perf_counter() - start
+        if elapsed < batch_time:
+            batch_time, batched = elapsed, pipeline
+
+    print(f"run_pipeline: {n_records / loop_time:,.0f} records/sec")
+    print(f"run_batch:    {n_records / batch_time:,.0f} records/sec "
+          f"(x{loop_time / batch_time:.1f})")
+    for stage in batched.get_stage_stats():
+        print(f"  {stage['stage']}: "
+              f"{stage['records_per_sec']:,.0f} records/sec")
+
+
+def benchmark_parallel(n_records: int = 200_000) -> None:
+    """Measure ParallelNexusManager throughput from 1 to N cores."""
+    cores: int = os.cpu_count() or 1
+    print(f"\n--- ParallelNexusManager scaling ({n_records} records, "
+          f"{cores} cores) ---")
+    items: List[Tuple[str, Any]] = [
+        (f"json_{i % 8}", {"sensor": "temp", "value": float(i % 40),
+                           "unit": "C"})
+        for i in range(n_records)
+    ]
+    baseline: float = 0.0
+    workers: int = 1
+    while True:
+        with ParallelNexusManager(workers=workers) as manager:
+            for n in range(8):
+                manager.register(JSONAdapter(f"json_{n}"))
+            start: float = time.perf_counter()
+            manager.map(items)
+            elapsed: float = time.perf_counter() - start
+        rate: float = n_records / elapsed
+        baseline = baseline or rate
+        print(f"{workers} worker(s): {rate:,.0f} records/sec "
+              f"(x{rate / baseline:.2f})")
+        if workers >= cores:
+            break
+        workers = min(workers * 2, cores)
+
+
+def benchmark_compile(n_records: int = 200_000) -> None:
+    """Per-record overhead of run_pipeline before and after compile()."""
+    print(f"\n--- compiled stage fusion ({n_records} records) ---")
+    values: List[Any] = [{"value": float(i % 40)} for i in range(n_records)]
+    timings: List[float] = []
+    for compiled in (False, True):
+        pipeline = JSONAdapter("bench_compile")
+        if compiled:
+            pipeline.compile()
+        records: List[Any] = [dict(v) for v in values]
+        start: float = time.perf_counter()
+        for record in records:
+            pipeline.run_pipeline(record)
+        timings.append(time.perf_counter() - start)
+    before: float = timings[0] / n_records * 1e9
+    after: float = timings[1] / n_records * 1e9
+    print(f"interpreted: {before:,.0f} ns/record")
+    print(f"compiled:    {after:,.0f} ns/record (x{before / after:.1f})")
+
+
+def benchmark_stream_readings(sizes: Tuple[int, ...] = (10 ** 6,)) -> None:
+    """StreamAdapter on a list vs array.array('d') (and NumPy if present).
+
+    The list path is skipped above 10^7 readings, where the list alone
+    would not fit in memory on most machines.
+    """
+    adapter = StreamAdapter("bench_stream")
+    for size in sizes:
+        print(f"\n--- StreamAdapter readings ({size:,}) ---")
+        readings = array.array("d", (float(i % 40) for i in range(size)))
+        inputs: List[Tuple[str, Any]] = [("array.array", readings)]
+        if np is not None:
+            inputs.append(("numpy", np.frombuffer(readings)))
+        if size <= 10 ** 7:
+            inputs.insert(0, ("list", readings.tolist()))
+        for label, data in inputs:
+            start: float = time.perf_counter()
+            adapter.process(data)
+            elapsed: float = time.perf_counter() - start
+            print(f"{label}: {elapsed * 1000:,.1f} ms "
+                  f"({size / elapsed:,.0f} readings/sec)")
+
+
+def benchmark_chain_stream(n_records: int = 200_000) -> None:
+    """Time-to-first-result of chain over a list vs chain_stream."""
+    print(f"\n--- chain vs chain_stream ({n_records} records) ---")
+    manager = NexusManager()
+    for pid in ("A", "B", "C"):
+        manager.register(JSONAdapter(pid))
+    ids: List[str] = ["A", "B", "C"]
+
+    start: float = time.perf_counter()
+    results: List[Any] = [manager.chain({"value": i}, ids)
+                          for i in range(n_records)]
+    total: float = time.perf_counter() - start
+    print(f"chain (materialized): first result after {total * 1000:,.1f} "
+          f"ms, {len(results)} results held in memory")
+
+    start = time.perf_counter()
+    stream: Iterator[Any] = manager.chain_stream(
+        ({"value": i} for i in range(n_records)), ids)
+    next(stream)
+    first: float = time.perf_counter() - start
+    count: int = 1 + sum(1 for _ in stream)
+    total = time.perf_counter() - start
+    print(f"chain_stream: first result after {first * 1e6:,.1f} us, "
+          f"{count} results in {total * 1000:,.1f} ms")
+
+
+def benchmark_columnar(n_records: int = 10 ** 6) -> None:
+    """Peak memory and throughput: dict records vs RecordBatch columns."""
+    print(f"\n--- dict records vs RecordBatch ({n_records:,} records) ---")
+    for label in ("dict run_batch", "RecordBatch run_columns"):
+        pipeline = JSONAdapter("bench_columnar")
+        tracemalloc.start()
+        start: float = time.perf_counter()
+        if label == "dict run_batch":
+            records: List[Any] = [
+                {"sensor": "temp", "value": float(i % 40), "seq": i}
+                for i in range(n_records)
+            ]
+            pipeline.run_batch(records)
+        else:
+            batch = RecordBatch({
+                "sensor": ["temp"] * n_records,
+                "value": array.array("d", (float(i % 40)
+                                           for i in range(n_records))),
+                "seq": array.array("q", range(n_records)),
+            }, n_records)
+            pipeline.run_columns(batch)
+        elapsed: float = time.perf_counter() - start
+        peak: int = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{label}: {n_records / elapsed:,.0f} records/sec, "
+              f"peak {peak / 2 ** 20:,.1f} MiB")
+
+
+def benchmark_codecs(n_records: int = 100_000) -> None:
+    """Encode/decode throughput of BinaryCodec against JSONCodec."""
+    print(f"\n--- wire codecs ({n_records:,} records) ---")
+    records: List[Any] = [
+        {"sensor": "temp", "value": float(i % 40), "seq": i,
+         "tags": ["site-a", "rack-3"]}
+        for i in range(n_records)
+    ]
+    codecs_to_test: List[Tuple[str, Codec]] = [("json", JSONCodec()),
+                                               ("binary", BinaryCodec())]
+    for label, codec in codecs_to_test:
+        start: float = time.perf_counter()
+        stream: bytes = b"".join(codec.encode(r) for r in records)
+        encode_time: float = time.perf_counter() - start
+        start = time.perf_counter()
+        decoded: int = sum(1 for _ in codec.iter_decode(stream))
+        decode_time: float = time.perf_counter() - start
+        print(f"{label}: {len(stream) / n_records:.0f} bytes/record, "
+              f"encode {n_records / encode_time:,.0f} records/sec, "
+              f"decode {decoded / decode_time:,.0f} records/sec")
+
+
+def benchmark_checkpoint(n_records: int = 200_000, rounds: int = 15) -> None:
+    """Throughput cost of chain_checkpointed over chain_stream.
+
+    Each round times both back to back; the overhead is the median of the
+    per-round ratios, which cancels the drift between rounds that a
+    best-of-N on either side alone would keep.
+    """
+    print(f"\n--- checkpoint overhead ({n_records:,} records) ---")
+    path: str = os.path.join(os.getcwd(), "nexus_bench.checkpoint")
+    best: List[float] = [float("inf"), float("inf")]
+    ratios: List[float] = []
+    for round_no in range(rounds):
+        elapsed: List[float] = [0.0, 0.0]
+        # alternate which side goes first so neither always runs warm
+        for checkpointed in ((False, True), (True, False))[round_no % 2]:
+            manager = NexusManager()
+            manager.register(JSONAdapter("A"))
+            manager.register(JSONAdapter("B"))
+            source = ({"value": i} for i in range(n_records))
+            start: float = time.perf_counter()
+            if checkpointed:
+                results = manager.chain_checkpointed(source, ["A", "B"],
+                                                     path)
+            else:
+                results = manager.chain_stream(source, ["A", "B"])
+            for _ in results:
+                pass
+            elapsed[checkpointed] = time.perf_counter() - start
+            best[checkpointed] = min(best[checkpointed],
+                                     elapsed[checkpointed])
+        ratios.append(elapsed[1] / elapsed[0])
+    os.remove(path)
+    overhead: float = (sorted(ratios)[rounds // 2] - 1) * 100
+    print(f"chain_stream:       {n_records / best[0]:,.0f} records/sec")
+    print(f"chain_checkpointed: {n_records / best[1]:,.0f} records/sec "
+          f"(median overhead {overhead:+.1f}%)")
+
+
+def benchmark_io_bound(n_records: int = 200, latency: float = 0.005) -> None:
+    """run_batch with a blocking stage, sequential vs io_bound fan-out."""
+    print(f"\n--- io_bound stage ({n_records} records, "
+          f"{latency * 1000:.0f} ms blocking call) ---")
+
+    class LookupStage:
+        def __init__(self, io_bound: bool):
+            self.io_bound: bool = io_bound
+            self.concurrency: int = 16
+
+        def process(self, data: Any) -> Any:
+            time.sleep(latency)
+            return data
+
+    for io_bound in (False, True):
+        pipeline = JSONAdapter("bench_io")
+        pipeline.add_stage(LookupStage(io_bound))
+        start: float = time.perf_counter()
+        pipeline.run_batch([{"value": i} for i in range(n_records)])
+        elapsed: float = time.perf_counter() - start
+        pipeline.close()
+        label: str = "io_bound x16" if io_bound else "sequential"
+        print(f"{label}: {n_records / elapsed:,.0f} records/sec")
+
+
+def run_benchmarks(large: bool = False) -> None:
+    print("=== CODE NEXUS - PIPELINE BENCHMARKS ===\n")
+    benchmark_run_batch()
+    benchmark_compile()
+    benchmark_stream_readings((10 ** 6, 10 ** 8) if large else (10 ** 6,))
+    benchmark_chain_stream()
+    benchmark_columnar()
+    benchmark_codecs()
+    benchmark_checkpoint()
+    benchmark_io_bound()
+    benchmark_parallel()
+
+
 if __name__ == "__main__":
+    if "--bench" in sys.argv[1:]:
+        run_benchmarks(large="--large" in sys.argv[1:])
+        sys.exit(0)
+
     print("=== CODE NEXUS - ENTERPRISE PIPELINE SYSTEM ===\n")
 
     print("Initializing Nexus Manager...")